@@ -0,0 +1,5 @@
+"""Minimal stand-in for :mod:`boto3.s3`."""
+
+from . import transfer
+
+__all__ = ["transfer"]
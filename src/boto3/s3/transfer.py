@@ -0,0 +1,27 @@
+"""Simplified stand-in for :mod:`boto3.s3.transfer`."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class TransferConfig:
+    """Record managed-transfer settings the way :class:`boto3.s3.transfer.TransferConfig` does."""
+
+    def __init__(
+        self,
+        multipart_threshold: int = 8 * 1024 * 1024,
+        max_concurrency: int = 10,
+        multipart_chunksize: int = 8 * 1024 * 1024,
+        use_threads: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        self.multipart_threshold = multipart_threshold
+        self.max_concurrency = max_concurrency
+        self.multipart_chunksize = multipart_chunksize
+        self.use_threads = use_threads
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+
+__all__ = ["TransferConfig"]
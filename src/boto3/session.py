@@ -3,49 +3,101 @@
 from __future__ import annotations
 
 import io
-from typing import Any, Dict
+from bisect import bisect_left, bisect_right, insort
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Tuple
 
 from botocore.exceptions import ClientError
 from botocore.response import StreamingBody
 
 
+class _Op:
+    """Integer identifiers for the operations implemented by :class:`S3Client`."""
+
+    HEAD_BUCKET = 0
+    CREATE_BUCKET = 1
+    PUT_BUCKET_ACCELERATE_CONFIGURATION = 2
+    PUT_OBJECT = 3
+    GET_OBJECT = 4
+    LIST_OBJECTS_V2 = 5
+    HEAD_OBJECT = 6
+
+
+# Operation names indexed by ``_Op`` identifier, used when handing calls to a Stubber.
+_OPERATION_NAMES: Tuple[str, ...] = (
+    "head_bucket",
+    "create_bucket",
+    "put_bucket_accelerate_configuration",
+    "put_object",
+    "get_object",
+    "list_objects_v2",
+    "head_object",
+)
+
+
 class S3Client:
     """Very small in-memory simulation of the S3 API used in tests."""
 
+    __slots__ = (
+        "region_name",
+        "meta",
+        "_buckets",
+        "_sorted_keys",
+        "_metadata",
+        "_active_stubber",
+        "_handlers",
+    )
+
     def __init__(self, region_name: str | None = None) -> None:
         self.region_name = region_name or "us-east-1"
-        self._buckets: Dict[str, Dict[str, bytes]] = {}
+        # Mirrors ``client.meta.region_name`` on real boto3 clients.
+        self.meta = SimpleNamespace(region_name=self.region_name)
+        # Objects are stored as ``(data, length)`` so GETs need not re-measure them.
+        self._buckets: Dict[str, Dict[str, Tuple[bytes, int]]] = {}
+        # Keys of each bucket in lexicographic order, mirroring S3 listing order.
+        self._sorted_keys: Dict[str, List[str]] = {}
+        # User metadata of the objects that were stored with any, by (bucket, key).
+        self._metadata: Dict[Tuple[str, str], Dict[str, str]] = {}
         self._active_stubber = None
+        # Handlers indexed by ``_Op`` identifier.
+        self._handlers: Tuple[Callable[..., Dict[str, Any]], ...] = (
+            self._handle_head_bucket,
+            self._handle_create_bucket,
+            self._handle_put_bucket_accelerate_configuration,
+            self._handle_put_object,
+            self._handle_get_object,
+            self._handle_list_objects_v2,
+            self._handle_head_object,
+        )
 
     # ------------------------------------------------------------------
     def head_bucket(self, **params: Any) -> Dict[str, Any]:
-        return self._dispatch("head_bucket", params)
+        return self._dispatch(_Op.HEAD_BUCKET, params)
 
     def create_bucket(self, **params: Any) -> Dict[str, Any]:
-        return self._dispatch("create_bucket", params)
+        return self._dispatch(_Op.CREATE_BUCKET, params)
 
     def put_bucket_accelerate_configuration(self, **params: Any) -> Dict[str, Any]:
-        return self._dispatch("put_bucket_accelerate_configuration", params)
+        return self._dispatch(_Op.PUT_BUCKET_ACCELERATE_CONFIGURATION, params)
 
     def put_object(self, **params: Any) -> Dict[str, Any]:
-        return self._dispatch("put_object", params)
+        return self._dispatch(_Op.PUT_OBJECT, params)
 
     def get_object(self, **params: Any) -> Dict[str, Any]:
-        return self._dispatch("get_object", params)
+        return self._dispatch(_Op.GET_OBJECT, params)
 
     def list_objects_v2(self, **params: Any) -> Dict[str, Any]:
-        return self._dispatch("list_objects_v2", params)
+        return self._dispatch(_Op.LIST_OBJECTS_V2, params)
+
+    def head_object(self, **params: Any) -> Dict[str, Any]:
+        return self._dispatch(_Op.HEAD_OBJECT, params)
 
     # ------------------------------------------------------------------
-    def _dispatch(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        stubber = getattr(self, "_active_stubber", None)
+    def _dispatch(self, op_id: int, params: Dict[str, Any]) -> Dict[str, Any]:
+        stubber = self._active_stubber
         if stubber is not None:
-            return stubber.consume(operation, params)
-
-        handler = getattr(self, f"_handle_{operation}", None)
-        if handler is None:
-            raise NotImplementedError(f"Operation {operation!r} is not implemented in the stub")
-        return handler(**params)
+            return stubber.consume(_OPERATION_NAMES[op_id], params)
+        return self._handlers[op_id](**params)
 
     # ------------------------------------------------------------------
     def _handle_head_bucket(self, Bucket: str) -> Dict[str, Any]:
@@ -60,6 +112,7 @@ class S3Client:
                 "CreateBucket",
             )
         self._buckets[Bucket] = {}
+        self._sorted_keys[Bucket] = []
         return {"Location": self.region_name}
 
     def _handle_put_bucket_accelerate_configuration(self, Bucket: str, **_: Any) -> Dict[str, Any]:
@@ -67,53 +120,177 @@ class S3Client:
             raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "PutAccelerate")
         return {}
 
-    def _handle_put_object(self, Bucket: str, Key: str, Body: bytes | str) -> Dict[str, Any]:
+    def _handle_put_object(
+        self,
+        Bucket: str,
+        Key: str,
+        Body: bytes | bytearray | memoryview | str,
+        Metadata: Dict[str, str] | None = None,
+    ) -> Dict[str, Any]:
         if Bucket not in self._buckets:
             raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "PutObject")
-        if isinstance(Body, str):
+        if type(Body) is bytes:
+            data = Body
+        elif isinstance(Body, str):
             data = Body.encode("utf-8")
+        elif (
+            isinstance(Body, memoryview)
+            and type(Body.obj) is bytes
+            and Body.c_contiguous
+            and Body.nbytes == len(Body.obj)
+        ):
+            # A forward view over a whole immutable bytes object can share its
+            # storage; strided or reversed views cover the same bytes in a
+            # different order.
+            data = Body.obj
         else:
-            data = Body
-        self._buckets[Bucket][Key] = bytes(data)
+            # Mutable buffers are copied so later edits don't leak into the bucket.
+            data = bytes(Body)
+        bucket = self._buckets[Bucket]
+        if Key not in bucket:
+            insort(self._sorted_keys[Bucket], Key)
+        bucket[Key] = (data, len(data))
+        if Metadata:
+            self._metadata[(Bucket, Key)] = dict(Metadata)
+        else:
+            self._metadata.pop((Bucket, Key), None)
         return {"ETag": "stub"}
 
-    def _handle_get_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+    def _handle_get_object(
+        self, Bucket: str, Key: str, Range: str | None = None
+    ) -> Dict[str, Any]:
         bucket = self._buckets.get(Bucket)
         if not bucket or Key not in bucket:
             raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "GetObject")
-        data = bucket[Key]
-        return {"Body": StreamingBody(io.BytesIO(data), len(data))}
+        data, length = bucket[Key]
+        if Range is not None:
+            # Only the ``bytes=<first>-<last>`` form is supported.
+            first, _, last = Range[len("bytes=") :].partition("-")
+            start = int(first)
+            if start >= length:
+                raise ClientError(
+                    {
+                        "Error": {"Code": "InvalidRange", "Message": "Range Not Satisfiable"},
+                        "ResponseMetadata": {"HTTPStatusCode": 416},
+                    },
+                    "GetObject",
+                )
+            data = data[start : int(last) + 1 if last else length]
+            length = len(data)
+        response: Dict[str, Any] = {"Body": StreamingBody(io.BytesIO(data), length)}
+        metadata = self._metadata.get((Bucket, Key))
+        if metadata:
+            response["Metadata"] = metadata
+        return response
 
-    def _handle_list_objects_v2(self, Bucket: str, Prefix: str, MaxKeys: int = 1) -> Dict[str, Any]:
+    def _handle_head_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        bucket = self._buckets.get(Bucket)
+        if not bucket or Key not in bucket:
+            raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+        return {
+            "ContentLength": bucket[Key][1],
+            "Metadata": self._metadata.get((Bucket, Key), {}),
+        }
+
+    def _handle_list_objects_v2(
+        self,
+        Bucket: str,
+        Prefix: str,
+        MaxKeys: int = 1,
+        Delimiter: str | None = None,
+        ContinuationToken: str | None = None,
+        FetchOwner: bool = False,
+    ) -> Dict[str, Any]:
         bucket = self._buckets.get(Bucket)
         if not bucket:
             return {}
 
-        contents = []
-        for key in bucket:
-            if key.startswith(Prefix):
-                contents.append({"Key": key})
-                if len(contents) >= MaxKeys:
+        sorted_keys = self._sorted_keys[Bucket]
+        if Delimiter:
+            return self._list_delimited(sorted_keys, Prefix, Delimiter, MaxKeys)
+        # Continuation tokens are simply the last key of the previous page.
+        if ContinuationToken is not None:
+            start = bisect_right(sorted_keys, ContinuationToken)
+        elif not Prefix:
+            start = 0
+        else:
+            start = bisect_left(sorted_keys, Prefix)
+        # One key past MaxKeys tells whether the listing is truncated.
+        window = sorted_keys[start : start + MaxKeys + 1]
+        if Prefix:
+            # Trim the window at the first key outside the prefix range before
+            # building the result; every key matches an empty prefix.
+            for count, key in enumerate(window):
+                if not key.startswith(Prefix):
+                    del window[count:]
                     break
-        if not contents:
+        truncated = len(window) > MaxKeys
+        del window[MaxKeys:]
+        if not window:
             return {}
-        return {"Contents": contents}
+        response: Dict[str, Any] = {
+            "Contents": [{"Key": key} for key in window],
+            "KeyCount": len(window),
+            "IsTruncated": truncated,
+        }
+        if truncated:
+            response["NextContinuationToken"] = window[-1]
+        return response
+
+    @staticmethod
+    def _list_delimited(
+        sorted_keys: List[str], prefix: str, delimiter: str, max_keys: int
+    ) -> Dict[str, Any]:
+        # Keys sharing a prefix up to the next delimiter roll up into a single
+        # common prefix, as S3 does; each entry of either kind counts toward MaxKeys.
+        contents: List[Dict[str, Any]] = []
+        common_prefixes: List[Dict[str, Any]] = []
+        last_common = None
+        for index in range(bisect_left(sorted_keys, prefix), len(sorted_keys)):
+            key = sorted_keys[index]
+            if not key.startswith(prefix):
+                break
+            cut = key.find(delimiter, len(prefix))
+            if cut == -1:
+                if len(contents) + len(common_prefixes) >= max_keys:
+                    break
+                contents.append({"Key": key})
+                continue
+            common = key[: cut + len(delimiter)]
+            if common == last_common:
+                continue
+            if len(contents) + len(common_prefixes) >= max_keys:
+                break
+            common_prefixes.append({"Prefix": common})
+            last_common = common
+
+        response: Dict[str, Any] = {}
+        if contents:
+            response["Contents"] = contents
+        if common_prefixes:
+            response["CommonPrefixes"] = common_prefixes
+        return response
 
 
 class Session:
     """A simplified analogue of :class:`boto3.session.Session`."""
 
+    __slots__ = ("profile_name", "region_name", "_clients")
+
     def __init__(self, profile_name: str | None = None, region_name: str | None = None) -> None:
         self.profile_name = profile_name
         self.region_name = region_name or "us-east-1"
         self._clients: Dict[str, Any] = {}
 
-    def client(self, service_name: str) -> Any:
+    def client(
+        self, service_name: str, region_name: str | None = None, config: Any | None = None
+    ) -> Any:
         if service_name != "s3":
             raise ValueError(f"Unsupported service: {service_name}")
-        if service_name not in self._clients:
-            self._clients[service_name] = S3Client(self.region_name)
-        return self._clients[service_name]
+        key = (service_name, region_name or self.region_name)
+        if key not in self._clients:
+            self._clients[key] = S3Client(key[1])
+        return self._clients[key]
 
 
 __all__ = ["Session", "S3Client"]
@@ -1,5 +1,5 @@
 """Minimal subset of the :mod:`botocore` package for the test suite."""
 
-from . import exceptions, response, stub
+from . import config, exceptions, response, stub
 
-__all__ = ["exceptions", "response", "stub"]
+__all__ = ["config", "exceptions", "response", "stub"]
@@ -0,0 +1,22 @@
+"""Simplified stand-in for :mod:`botocore.config`."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class Config:
+    """Record client options the way :class:`botocore.config.Config` does."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._user_provided_options = dict(kwargs)
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+    def merge(self, other_config: "Config") -> "Config":
+        options = dict(self._user_provided_options)
+        options.update(other_config._user_provided_options)
+        return Config(**options)
+
+
+__all__ = ["Config"]
@@ -7,11 +7,10 @@ class ClientError(Exception):
     """Exception raised to mirror :class:`botocore.exceptions.ClientError`."""
 
     def __init__(self, error_response: dict | None = None, operation_name: str | None = None):
-        self.response = error_response or {}
+        self.response = error_response if error_response is not None else {}
         self.operation_name = operation_name or ""
-        message = self.response.get("Error", {}).get("Message")
-        if not message:
-            message = f"An error occurred ({self.response.get('Error', {}).get('Code', 'Unknown')})"
+        error = self.response.get("Error") or {}
+        message = error.get("Message") or f"An error occurred ({error.get('Code', 'Unknown')})"
         super().__init__(message)
 
 
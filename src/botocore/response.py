@@ -2,23 +2,31 @@
 
 from __future__ import annotations
 
+import io
 from typing import BinaryIO, Iterable, Iterator
 
 
 class StreamingBody:
     """A minimal, file-like wrapper that mimics botocore's ``StreamingBody``."""
 
+    __slots__ = ("_raw_stream", "_needs_encode")
+
     def __init__(self, raw_stream: BinaryIO, content_length: int):
+        # *content_length* is accepted for botocore compatibility only.
         self._raw_stream = raw_stream
-        self._remaining = content_length
+        # Binary streams never need re-encoding, so decide once rather than
+        # type-checking every chunk.
+        self._needs_encode = not isinstance(raw_stream, (io.BufferedIOBase, io.RawIOBase))
 
     def read(self, amt: int | None = None) -> bytes:
         data = self._raw_stream.read() if amt is None else self._raw_stream.read(amt)
-        if not isinstance(data, (bytes, bytearray)):
+        if self._needs_encode and not isinstance(data, (bytes, bytearray)):
             data = data.encode("utf-8")
-        self._remaining = max(0, self._remaining - len(data))
         return data
 
+    def close(self) -> None:
+        self._raw_stream.close()
+
     def iter_chunks(self, chunk_size: int = 8192) -> Iterator[bytes]:
         while True:
             data = self.read(chunk_size)
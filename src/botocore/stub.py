@@ -2,23 +2,22 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+import sys
+from collections import deque
+from typing import Any, Deque, Dict, Tuple
 
-
-@dataclass
-class _QueuedResponse:
-    operation: str
-    expected_params: Dict[str, Any] | None
-    response: Any
+# Queued entries are ``(operation, expected_params, response)`` tuples.
+_QueuedResponse = Tuple[str, "Dict[str, Any] | None", Any]
 
 
 class Stubber:
     """Queue stubbed responses for a client."""
 
+    __slots__ = ("client", "_queue", "_active")
+
     def __init__(self, client: Any) -> None:
         self.client = client
-        self._queue: List[_QueuedResponse] = []
+        self._queue: Deque[_QueuedResponse] = deque()
         self._active = False
 
     def add_response(
@@ -26,19 +25,23 @@ class Stubber:
         operation_name: str,
         service_response: Any | None,
         expected_params: Dict[str, Any] | None = None,
+        *,
+        copy_params: bool = False,
     ) -> None:
-        """Queue a response for *operation_name*."""
+        """Queue a response for *operation_name*.
 
-        self._queue.append(
-            _QueuedResponse(
-                operation=operation_name,
-                expected_params=dict(expected_params) if expected_params is not None else None,
-                response=service_response,
-            )
-        )
+        *expected_params* is stored by reference; pass ``copy_params=True`` if
+        the caller intends to mutate the mapping after queuing it.
+        """
+
+        if copy_params and expected_params is not None:
+            expected_params = dict(expected_params)
+        # The operation name is interned so consume() compares against the
+        # client's literal operation names by identity.
+        self._queue.append((sys.intern(operation_name), expected_params, service_response))
 
     def __enter__(self) -> "Stubber":
-        if getattr(self.client, "_active_stubber", None) is not None:
+        if self.client._active_stubber is not None:
             raise RuntimeError("A stubber is already active on this client")
         self.client._active_stubber = self
         self._active = True
@@ -55,19 +58,18 @@ class Stubber:
         if not self._queue:
             raise AssertionError(f"Unexpected call to {operation_name}; no responses queued")
 
-        queued = self._queue.pop(0)
-        if queued.operation != operation_name:
+        operation, expected_params, response = self._queue.popleft()
+        if operation != operation_name:
             raise AssertionError(
-                f"Expected call to {queued.operation!r} but got {operation_name!r}"
+                f"Expected call to {operation!r} but got {operation_name!r}"
             )
 
-        if queued.expected_params is not None and queued.expected_params != params:
+        if expected_params is not None and expected_params != params:
             raise AssertionError(
                 "Parameters did not match expected values for "
-                f"{operation_name!r}: expected {queued.expected_params!r}, got {params!r}"
+                f"{operation_name!r}: expected {expected_params!r}, got {params!r}"
             )
 
-        response = queued.response
         if isinstance(response, Exception):
             raise response
         return response
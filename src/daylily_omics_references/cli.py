@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
-import argparse
+import functools
 import logging
 import sys
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
-from .constants import DEFAULT_REFERENCE_VERSION, SUPPORTED_REFERENCE_VERSIONS
+from .constants import (
+    COPY_METHODS,
+    DEFAULT_COPY_METHOD,
+    DEFAULT_REFERENCE_VERSION,
+    INCLUDE_B37,
+    INCLUDE_GIAB,
+    INCLUDE_HG38,
+    SUPPORTED_REFERENCE_VERSIONS,
+    SUPPORTED_REFERENCE_VERSIONS_SET,
+)
 from .manager import BucketVerificationError, ReferenceBucketManager
 
+if TYPE_CHECKING:  # pragma: no cover
+    import argparse
+
+
+_VERSION_METAVAR = "{" + ",".join(SUPPORTED_REFERENCE_VERSIONS) + "}"
+
 
 def _setup_logging(level: str) -> None:
     logging.basicConfig(
@@ -18,7 +33,12 @@ def _setup_logging(level: str) -> None:
     )
 
 
-def _parse_args(argv: Iterable[str]) -> argparse.Namespace:
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    # argparse keeps no state between parses, so the parser is built once and reused.
+    # It is imported here so importing this module does not pay for argparse.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Manage Daylily omics analysis reference buckets",
     )
@@ -44,7 +64,7 @@ def _parse_args(argv: Iterable[str]) -> argparse.Namespace:
     clone.add_argument(
         "--version",
         default=DEFAULT_REFERENCE_VERSION,
-        choices=SUPPORTED_REFERENCE_VERSIONS,
+        metavar=_VERSION_METAVAR,
         help="Reference data version to clone",
     )
     clone.add_argument(
@@ -70,7 +90,21 @@ def _parse_args(argv: Iterable[str]) -> argparse.Namespace:
     clone.add_argument(
         "--use-acceleration",
         action="store_true",
-        help="Use the S3 accelerate endpoint during copy operations",
+        help="Use the S3 accelerate endpoint during copy operations (AWS CLI method only)",
+    )
+    clone.add_argument(
+        "--copy-method",
+        default=DEFAULT_COPY_METHOD,
+        choices=COPY_METHODS,
+        help=(
+            "How to copy reference prefixes: server-side boto3 copies, the same "
+            "copies driven by aioboto3 (async), the AWS CLI, or S3 Batch Operations "
+            f"jobs (default: {DEFAULT_COPY_METHOD})"
+        ),
+    )
+    clone.add_argument(
+        "--batch-role-arn",
+        help="IAM role assumed by S3 Batch Operations when --copy-method is s3-batch",
     )
     clone.add_argument(
         "--log-file",
@@ -82,7 +116,7 @@ def _parse_args(argv: Iterable[str]) -> argparse.Namespace:
     verify.add_argument(
         "--version",
         default=DEFAULT_REFERENCE_VERSION,
-        choices=SUPPORTED_REFERENCE_VERSIONS,
+        metavar=_VERSION_METAVAR,
         help="Expected reference data version",
     )
     verify.add_argument(
@@ -100,6 +134,14 @@ def _parse_args(argv: Iterable[str]) -> argparse.Namespace:
         action="store_true",
         help="Skip checking GIAB reads",
     )
+    verify.add_argument(
+        "--manifest",
+        metavar="PATH",
+        help=(
+            "File listing expected object keys, one per line; lists each checked "
+            "prefix in full and reports keys that are missing"
+        ),
+    )
 
     ensure = sub.add_parser(
         "ensure",
@@ -113,7 +155,7 @@ def _parse_args(argv: Iterable[str]) -> argparse.Namespace:
     ensure.add_argument(
         "--version",
         default=DEFAULT_REFERENCE_VERSION,
-        choices=SUPPORTED_REFERENCE_VERSIONS,
+        metavar=_VERSION_METAVAR,
         help="Expected reference data version",
     )
     ensure.add_argument(
@@ -144,25 +186,67 @@ def _parse_args(argv: Iterable[str]) -> argparse.Namespace:
     ensure.add_argument(
         "--use-acceleration",
         action="store_true",
-        help="Use the S3 accelerate endpoint during clone operations",
+        help="Use the S3 accelerate endpoint during clone operations (AWS CLI method only)",
+    )
+    ensure.add_argument(
+        "--copy-method",
+        default=DEFAULT_COPY_METHOD,
+        choices=COPY_METHODS,
+        help=(
+            "How to copy reference prefixes: server-side boto3 copies, the same "
+            "copies driven by aioboto3 (async), the AWS CLI, or S3 Batch Operations "
+            f"jobs (default: {DEFAULT_COPY_METHOD})"
+        ),
+    )
+    ensure.add_argument(
+        "--batch-role-arn",
+        help="IAM role assumed by S3 Batch Operations when --copy-method is s3-batch",
     )
     ensure.add_argument(
         "--log-file",
         help="Optional path to capture AWS CLI output when cloning",
     )
 
-    return parser.parse_args(list(argv))
+    return parser
+
+
+def _parse_args(argv: Iterable[str]) -> argparse.Namespace:
+    parser = _build_parser()
+    args = parser.parse_args(list(argv))
+    # Versions are validated against a frozenset rather than via argparse
+    # ``choices``, which would probe the tuple linearly.
+    if args.version not in SUPPORTED_REFERENCE_VERSIONS_SET:
+        choices = ", ".join(repr(version) for version in SUPPORTED_REFERENCE_VERSIONS)
+        parser.error(
+            f"argument --version: invalid choice: {args.version!r} (choose from {choices})"
+        )
+    return args
+
+
+def _read_manifest(path: str) -> list[str]:
+    """Return the object keys listed in *path*, skipping blanks and ``#`` comments."""
+
+    with open(path, encoding="utf-8") as handle:
+        return [
+            line.strip() for line in handle if line.strip() and not line.lstrip().startswith("#")
+        ]
 
 
 def main(argv: Iterable[str] | None = None) -> int:
     args = _parse_args(argv or sys.argv[1:])
     _setup_logging(args.log_level)
 
-    manager = ReferenceBucketManager(profile=args.profile, region=args.region)
+    manager = ReferenceBucketManager(
+        profile=args.profile,
+        region=args.region,
+        batch_role_arn=getattr(args, "batch_role_arn", None),
+    )
 
-    include_hg38 = not getattr(args, "exclude_hg38", False)
-    include_b37 = not getattr(args, "exclude_b37", False)
-    include_giab = not getattr(args, "exclude_giab", False)
+    include_mask = (
+        (0 if getattr(args, "exclude_hg38", False) else INCLUDE_HG38)
+        | (0 if getattr(args, "exclude_b37", False) else INCLUDE_B37)
+        | (0 if getattr(args, "exclude_giab", False) else INCLUDE_GIAB)
+    )
 
     try:
         if args.command == "clone":
@@ -174,19 +258,17 @@ def main(argv: Iterable[str] | None = None) -> int:
                 region=region,
                 version=args.version,
                 dry_run=not args.execute,
-                include_hg38=include_hg38,
-                include_b37=include_b37,
-                include_giab=include_giab,
+                include_mask=include_mask,
                 use_acceleration=args.use_acceleration,
                 log_file=args.log_file,
+                method=args.copy_method,
             )
         elif args.command == "verify":
             manager.verify_bucket(
                 args.bucket,
                 expected_version=args.version,
-                include_hg38=include_hg38,
-                include_b37=include_b37,
-                include_giab=include_giab,
+                include_mask=include_mask,
+                expected_keys=_read_manifest(args.manifest) if args.manifest else None,
             )
         elif args.command == "ensure":
             region = args.region or manager.region
@@ -196,11 +278,10 @@ def main(argv: Iterable[str] | None = None) -> int:
                 bucket_prefix=args.bucket_prefix,
                 region=region,
                 version=args.version,
-                include_hg38=include_hg38,
-                include_b37=include_b37,
-                include_giab=include_giab,
+                include_mask=include_mask,
                 use_acceleration=args.use_acceleration,
                 log_file=args.log_file,
+                method=args.copy_method,
                 dry_run=not args.execute,
                 create_missing=not args.no_create,
             )
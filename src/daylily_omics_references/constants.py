@@ -10,6 +10,7 @@ SOURCE_BUCKET_BY_VERSION = {
 }
 
 SUPPORTED_REFERENCE_VERSIONS = tuple(SOURCE_BUCKET_BY_VERSION.keys())
+SUPPORTED_REFERENCE_VERSIONS_SET = frozenset(SUPPORTED_REFERENCE_VERSIONS)
 
 # Prefixes that are always required in a destination bucket.
 CORE_PREFIXES = (
@@ -35,4 +36,25 @@ GIAB_PREFIXES = (
     "data/genomic_data/organism_reads/",
 )
 
+# Bit flags selecting the optional prefix groups above.
+INCLUDE_HG38 = 1 << 0
+INCLUDE_B37 = 1 << 1
+INCLUDE_GIAB = 1 << 2
+INCLUDE_ALL = INCLUDE_HG38 | INCLUDE_B37 | INCLUDE_GIAB
+
+# Strategies for copying prefixes: server-side copies through boto3 (threaded,
+# or on an asyncio event loop via the optional aioboto3), the legacy
+# ``aws s3 cp --recursive`` subprocess per prefix, or an S3 Batch Operations job
+# per prefix.
+COPY_METHOD_BOTO3 = "boto3"
+COPY_METHOD_ASYNC = "async"
+COPY_METHOD_CLI = "cli"
+COPY_METHOD_S3_BATCH = "s3-batch"
+COPY_METHODS = (COPY_METHOD_BOTO3, COPY_METHOD_ASYNC, COPY_METHOD_CLI, COPY_METHOD_S3_BATCH)
+DEFAULT_COPY_METHOD = COPY_METHOD_BOTO3
+
+# Empty marker object written under each prefix once it has been fully copied,
+# letting verification use a HEAD request instead of a LIST.
+PREFIX_SENTINEL_NAME = ".daylily_ok"
+
 VERSION_INFO_KEY = "s3_reference_data_version.info"
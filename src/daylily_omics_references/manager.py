@@ -2,29 +2,265 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import logging
 import os
 import shlex
 import subprocess
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import Callable, List, Sequence
+from typing import Any, Callable, Deque, Dict, Iterable, List, Sequence, Set, TextIO, Tuple, TypeVar
+from urllib.parse import quote
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+try:  # Optional: drives the "async" copy method.
+    import aioboto3
+    from aiobotocore.config import AioConfig
+except ImportError:  # pragma: no cover - depends on the environment
+    aioboto3 = None
+
 from .constants import (
     B37_PREFIXES,
+    COPY_METHOD_ASYNC,
+    COPY_METHOD_BOTO3,
+    COPY_METHOD_CLI,
+    COPY_METHOD_S3_BATCH,
+    COPY_METHODS,
     CORE_PREFIXES,
+    DEFAULT_COPY_METHOD,
     DEFAULT_REFERENCE_VERSION,
     GIAB_PREFIXES,
     HG38_PREFIXES,
+    INCLUDE_ALL,
+    INCLUDE_B37,
+    INCLUDE_GIAB,
+    INCLUDE_HG38,
+    PREFIX_SENTINEL_NAME,
     SOURCE_BUCKET_BY_VERSION,
     VERSION_INFO_KEY,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# The version marker is a short string; never read more than this much of it.
+_VERSION_MARKER_MAX_BYTES = 64
+
+_T = TypeVar("_T")
+
+_MB = 1024 * 1024
+
+# Number of objects copied concurrently by the boto3 copy path.
+_COPY_WORKERS = 64
+
+# Copies submitted per prefix ahead of the one being waited on, so a huge
+# prefix never materialises a future for every key.
+_COPY_BACKLOG = 2 * _COPY_WORKERS
+
+# Worker coroutines, and so copies in flight, on the async copy path.
+_ASYNC_COPY_LIMIT = 256
+
+# Largest object a single CopyObject request may copy; bigger objects use a
+# managed multipart copy.
+_MAX_COPY_OBJECT_BYTES = 5 * 1024 * _MB
+
+# Default size of the HTTP connection pool of clients built by the manager; it
+# should cover the copy and verification thread pools.
+_MAX_POOL_CONNECTIONS = 64
+
+# Default number of prefixes probed concurrently by verify_bucket.
+_VERIFY_WORKERS = 32
+
+# Prefix checks at or above this count list each parent "directory" once and
+# bucket the returned common prefixes client-side, instead of one LIST each.
+_BULK_PREFIX_THRESHOLD = 4
+
+# Upper bound on prefixes copied concurrently during a clone.
+_MAX_PREFIX_CONCURRENCY = 16
+_PREFIX_CONCURRENCY_ENV = "DAYLILY_MAX_PREFIX_CONCURRENCY"
+
+# Version reads are memoised for this many seconds (0 disables the cache); the
+# reference data in a bucket does not change once cloned.
+_VERSION_CACHE_TTL = 3600
+_VERSION_CACHE_TTL_ENV = "DAYLILY_VERSION_CACHE_TTL"
+_VERSION_CACHE_SIZE = 32
+
+# Write buffer for the clone log, which is kept open for the whole clone.
+_LOG_BUFFER_SIZE = 1 << 16
+
+# Destination-bucket location of S3 Batch Operations manifests and reports.
+_BATCH_MANIFEST_PREFIX = "_manifests/"
+_BATCH_POLL_SECONDS = 30
+# Jobs still running after this long are cancelled.
+_BATCH_TIMEOUT_SECONDS = 12 * 3600
+_BATCH_TERMINAL_STATUSES = frozenset({"Complete", "Failed", "Cancelled"})
+
+# As on the async path, objects a single CopyObject can handle are copied with
+# one request; s3transfer switches to multipart at sizes >= the threshold.
+# Larger objects use UploadPartCopy, with the parts of one object copied in the
+# calling worker thread: the copy pool already provides the concurrency, and
+# nested part threads would overrun the client's connection pool.
+_COPY_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_MAX_COPY_OBJECT_BYTES + 1,
+    multipart_chunksize=64 * _MB,
+    max_concurrency=1,
+    use_threads=False,
+)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Return the integer value of environment variable *name*, or *default*."""
+
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+def _include_mask(
+    include_mask: int | None,
+    include_hg38: bool,
+    include_b37: bool,
+    include_giab: bool,
+) -> int:
+    """Return *include_mask* or, if ``None``, pack the ``include_*`` flags into one."""
+
+    if include_mask is not None:
+        return include_mask
+    return (
+        (INCLUDE_HG38 if include_hg38 else 0)
+        | (INCLUDE_B37 if include_b37 else 0)
+        | (INCLUDE_GIAB if include_giab else 0)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _default_client_config(max_pool_connections: int) -> Config:
+    return Config(
+        max_pool_connections=max_pool_connections,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 10},
+        s3={"addressing_style": "virtual", "use_accelerate_endpoint": False},
+    )
+
+
+# Building an S3 client loads and parses the service model, so managers created
+# with default arguments share one client per (profile, region, pool size).
+# Clients are thread-safe; sessions are not, so each manager keeps its own and
+# this client is built from a session private to the cache.
+@functools.lru_cache(maxsize=8)
+def _default_s3_client(profile: str | None, region: str | None, max_pool_connections: int):
+    session = boto3.session.Session(profile_name=profile, region_name=region)
+    return session.client("s3", config=_default_client_config(max_pool_connections))
+
+
+# Names of the INCLUDE_* bits as recorded in the version marker metadata.
+_INCLUDE_NAMES: Tuple[Tuple[int, str], ...] = (
+    (INCLUDE_HG38, "hg38"),
+    (INCLUDE_B37, "b37"),
+    (INCLUDE_GIAB, "giab"),
+)
+
+# The prefixes a bucket holds for every combination of ``INCLUDE_*`` bits,
+# indexed by include mask.
+_PREFIXES_BY_MASK: Tuple[Tuple[str, ...], ...] = tuple(
+    CORE_PREFIXES
+    + (HG38_PREFIXES if mask & INCLUDE_HG38 else ())
+    + (B37_PREFIXES if mask & INCLUDE_B37 else ())
+    + (GIAB_PREFIXES if mask & INCLUDE_GIAB else ())
+    for mask in range(INCLUDE_ALL + 1)
+)
+
+
+def _run_coroutine(coro):
+    """Run *coro* to completion and return its result.
+
+    ``asyncio.run`` refuses to start inside a running event loop, so callers
+    that already have one get the coroutine run on a helper thread instead.
+    """
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _copy_command_template(*, request_payer: str, use_acceleration: bool) -> Tuple[str, ...]:
+    """Return the ``aws s3 cp`` arguments with the two URIs left blank.
+
+    Indices 3 and 4 hold the source and destination and are filled per prefix.
+    """
+
+    command = (
+        "aws",
+        "s3",
+        "cp",
+        "",
+        "",
+        "--recursive",
+        "--request-payer",
+        request_payer,
+        "--metadata-directive",
+        "REPLACE",
+    )
+    if use_acceleration:
+        command += ("--endpoint-url", "https://s3-accelerate.amazonaws.com")
+    return command
+
+
+class _TTLCache:
+    """A small bucket-keyed cache whose entries expire *ttl* seconds after being set.
+
+    Once *maxsize* entries are held the oldest one is evicted.
+    """
+
+    __slots__ = ("maxsize", "ttl", "_entries")
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)), None)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
 
 class BucketVerificationError(RuntimeError):
     """Raised when a reference bucket fails verification."""
@@ -36,14 +272,31 @@ class BucketVerificationError(RuntimeError):
         self.issues = list(issues)
 
 
-@dataclass
+class _CopyCancelled(RuntimeError):
+    """Raised by a copy that stopped because the clone is being abandoned."""
+
+
+@dataclass(frozen=True, slots=True)
 class CopyOperation:
     """Describes a copy operation from the source to the destination bucket."""
 
     description: str
     source_prefix: str
     destination_prefix: str
-    include: bool = True
+
+
+# Copy plans matching _PREFIXES_BY_MASK; operations are immutable and shared.
+_COPY_PLAN_BY_MASK: Tuple[Tuple[CopyOperation, ...], ...] = tuple(
+    tuple(
+        CopyOperation(
+            description=prefix.rstrip("/"),
+            source_prefix=prefix,
+            destination_prefix=prefix,
+        )
+        for prefix in prefixes
+    )
+    for prefixes in _PREFIXES_BY_MASK
+)
 
 
 class ReferenceBucketManager:
@@ -58,13 +311,77 @@ class ReferenceBucketManager:
         s3_client=None,
         command_runner: Callable[..., subprocess.CompletedProcess] | None = None,
         logger: logging.Logger | None = None,
+        batch_role_arn: str | None = None,
+        verify_workers: int = _VERIFY_WORKERS,
+        max_pool_connections: int = _MAX_POOL_CONNECTIONS,
+        use_sentinel: bool = True,
     ) -> None:
+        """Create a manager.
+
+        When *s3_client* is omitted the manager builds one with keep-alive
+        connections, adaptive retries and a pool of *max_pool_connections*
+        connections, so concurrent copies and verification probes reuse
+        connections instead of re-handshaking.  Managers created without a
+        *session* or *s3_client* share one cached client per profile, region
+        and pool size, but each gets its own session.
+
+        With *use_sentinel* enabled, prefix checks in buckets whose version
+        marker records that they were cloned with sentinels first look for the
+        ``.daylily_ok`` marker written after each prefix is cloned, and only
+        list the prefix when the marker is absent.
+        """
+
         self.profile = profile
+        self.use_sentinel = use_sentinel
+        self.batch_role_arn = batch_role_arn
+        self.verify_workers = verify_workers
         self.region = region
         self.session = session or boto3.session.Session(profile_name=profile, region_name=region)
-        self.s3_client = s3_client or self.session.client("s3")
+        # boto3 sessions are not thread-safe; clients made after construction
+        # are created under this lock since copies run on worker threads.
+        self._session_lock = threading.Lock()
+        # Only clients created here get the pooled configuration; a caller
+        # supplied client is used as-is, including when following redirects.
+        self._client_config: Config | None = None
+        if s3_client is None:
+            self._client_config = _default_client_config(max_pool_connections)
+            if session is None:
+                s3_client = _default_s3_client(profile, region, max_pool_connections)
+            else:
+                s3_client = session.client("s3", config=self._client_config)
+        self.s3_client = s3_client
         self.command_runner = command_runner or subprocess.run
         self.logger = logger or _LOGGER
+        # Serialises log file writes from concurrent copies.
+        self._log_lock = threading.Lock()
+        # Memoised S3 probes; see invalidate_cache().  Only prefixes known to
+        # contain objects are remembered, since a clone may fill in missing ones.
+        self._head_cache: Dict[str, bool] = {}
+        self._prefix_cache: Set[Tuple[str, str]] = set()
+        # Keys seen and continuation token of prefix probes that stopped early
+        # during a deep verification, so its full listings can resume them.
+        # Probes run on worker threads, hence the lock.
+        self._listing_cursors: Dict[Tuple[str, str], Tuple[Tuple[str, ...], str]] = {}
+        self._cursor_lock = threading.Lock()
+        # Version markers (version and metadata) read from buckets; only
+        # successful reads are kept.
+        version_ttl = _env_int(_VERSION_CACHE_TTL_ENV, _VERSION_CACHE_TTL)
+        self._version_cache = _TTLCache(maxsize=_VERSION_CACHE_SIZE, ttl=version_ttl)
+
+    def invalidate_cache(self) -> None:
+        """Forget memoised bucket and prefix existence checks and bucket versions."""
+
+        self._head_cache.clear()
+        self._prefix_cache.clear()
+        with self._cursor_lock:
+            self._listing_cursors.clear()
+        self._version_cache.clear()
+
+    def _new_client(self, service_name: str, **kwargs: Any):
+        """Create a *service_name* client from :attr:`session`."""
+
+        with self._session_lock:
+            return self.session.client(service_name, **kwargs)
 
     # ------------------------------------------------------------------
     # Bucket helpers
@@ -88,13 +405,27 @@ class ReferenceBucketManager:
         )
 
         # Recreate the client bound to the bucket's actual region.
-        self.s3_client = self.session.client("s3", region_name=bucket_region)
+        client_kwargs = {"region_name": bucket_region}
+        if self._client_config is not None:
+            client_kwargs["config"] = self._client_config
+        self.s3_client = self._new_client("s3", **client_kwargs)
         self.region = bucket_region
         return True
 
     def bucket_exists(self, bucket: str) -> bool:
-        """Return ``True`` if *bucket* exists."""
+        """Return ``True`` if *bucket* exists.
+
+        Results are memoised per manager; call :meth:`invalidate_cache` to re-probe.
+        """
+
+        cached = self._head_cache.get(bucket)
+        if cached is not None:
+            return cached
+        exists = self._head_bucket(bucket)
+        self._head_cache[bucket] = exists
+        return exists
 
+    def _head_bucket(self, bucket: str) -> bool:
         try:
             self.s3_client.head_bucket(Bucket=bucket)
         except ClientError as error:
@@ -122,6 +453,7 @@ class ReferenceBucketManager:
 
         self.logger.info("Creating bucket %s in %s", bucket, region)
         self.s3_client.create_bucket(**create_args)
+        self._head_cache[bucket] = True
 
         # Accelerate access is always enabled to match the historic behaviour of
         # the shell script this manager supersedes.
@@ -133,8 +465,20 @@ class ReferenceBucketManager:
     # ------------------------------------------------------------------
     # Version helpers
     # ------------------------------------------------------------------
-    def write_version_file(self, bucket: str, version: str, *, dry_run: bool = False) -> None:
-        """Write the version marker file to *bucket*."""
+    def write_version_file(
+        self,
+        bucket: str,
+        version: str,
+        *,
+        dry_run: bool = False,
+        include_mask: int = INCLUDE_ALL,
+    ) -> None:
+        """Write the version marker file to *bucket*.
+
+        The marker also carries *version*, the subsets selected by
+        *include_mask* and the fact that cloned prefixes get a sentinel as user
+        metadata; see :meth:`read_bucket_metadata`.
+        """
 
         if dry_run:
             self.logger.info(
@@ -143,139 +487,570 @@ class ReferenceBucketManager:
             return
 
         self.logger.debug("Uploading version marker %s to %s", VERSION_INFO_KEY, bucket)
+        self._version_cache.pop(bucket)
         self.s3_client.put_object(
             Bucket=bucket,
             Key=VERSION_INFO_KEY,
             Body=version.encode("utf-8"),
+            Metadata={
+                "version": version,
+                "sentinels": "1",
+                **{
+                    f"include-{name}": "1" if include_mask & bit else "0"
+                    for bit, name in _INCLUDE_NAMES
+                },
+            },
         )
 
+    def _write_prefix_sentinel(self, bucket: str, prefix: str) -> None:
+        """Mark *prefix* in *bucket* as completely copied."""
+
+        self.s3_client.put_object(Bucket=bucket, Key=f"{prefix}{PREFIX_SENTINEL_NAME}", Body=b"")
+
     def read_bucket_version(self, bucket: str) -> str | None:
-        """Return the version recorded in the bucket, if present."""
+        """Return the version recorded in the bucket, if present.
+
+        Versions found are cached for ``DAYLILY_VERSION_CACHE_TTL`` seconds
+        (default one hour); see :meth:`invalidate_cache`.
+        """
+
+        marker = self._read_version_marker(bucket)
+        return None if marker is None else marker[0]
 
+    def read_bucket_metadata(self, bucket: str) -> Dict[str, str] | None:
+        """Return the user metadata of the bucket's version marker, if present.
+
+        Markers written before the metadata was introduced return an empty dict.
+        The result is a copy, so callers may modify it without affecting the cache.
+        """
+
+        marker = self._read_version_marker(bucket)
+        return None if marker is None else dict(marker[1])
+
+    def _read_version_marker(self, bucket: str) -> Tuple[str, Dict[str, str]] | None:
+        """Return the version and user metadata of the marker, or ``None`` if unreadable.
+
+        Reading the marker also proves the bucket exists, which is remembered as
+        :meth:`bucket_exists` would, so callers need no separate HeadBucket.
+        """
+
+        cached = self._version_cache.get(bucket)
+        if cached is not None:
+            return cached
         try:
-            response = self.s3_client.get_object(Bucket=bucket, Key=VERSION_INFO_KEY)
-        except ClientError:
+            response = self._get_version_marker(bucket)
+        except ClientError as error:
+            # S3 rejects any range on an empty object; report it as an empty version.
+            status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            if status == 416 or error.response.get("Error", {}).get("Code") == "InvalidRange":
+                self._head_cache[bucket] = True
+                return "", {}
             return None
 
         body = response.get("Body")
         if body is None:
             return None
-        data = body.read().decode("utf-8").strip()
-        return data
+        self._head_cache[bucket] = True
+        data = body.read(_VERSION_MARKER_MAX_BYTES).decode("utf-8").strip()
+        marker = (data, response.get("Metadata") or {})
+        self._version_cache[bucket] = marker
+        return marker
+
+    def _get_version_marker(self, bucket: str) -> Dict[str, Any]:
+        params = {
+            "Bucket": bucket,
+            "Key": VERSION_INFO_KEY,
+            "Range": f"bytes=0-{_VERSION_MARKER_MAX_BYTES - 1}",
+        }
+        try:
+            return self.s3_client.get_object(**params)
+        except ClientError as error:
+            if not self._maybe_redirect_s3_client(bucket, error):
+                raise
+        return self.s3_client.get_object(**params)
 
     # ------------------------------------------------------------------
     # Copy helpers
     # ------------------------------------------------------------------
-    def _build_copy_plan(
+    def _build_copy_plan(self, *, include_mask: int) -> List[CopyOperation]:
+        return list(_COPY_PLAN_BY_MASK[include_mask & INCLUDE_ALL])
+
+    def _copy_prefix(
         self,
         *,
-        include_hg38: bool,
-        include_b37: bool,
-        include_giab: bool,
-    ) -> List[CopyOperation]:
-        plan: List[CopyOperation] = []
-
-        for prefix in CORE_PREFIXES:
-            plan.append(
-                CopyOperation(
-                    description=prefix.rstrip("/"),
-                    source_prefix=prefix,
-                    destination_prefix=prefix,
-                )
+        method: str,
+        source_bucket: str,
+        destination_bucket: str,
+        prefix: str,
+        dry_run: bool,
+        use_acceleration: bool,
+        log_handle: TextIO | None,
+        executor: Executor | None = None,
+        command_template: Sequence[str] | None = None,
+        destination_region: str | None = None,
+        stop: threading.Event | None = None,
+    ) -> int:
+        """Copy *prefix* with *method* and return how many objects were copied.
+
+        Setting *stop* asks a copy in progress to give up early.
+        """
+
+        if method == COPY_METHOD_CLI:
+            return self._run_copy_command(
+                source_bucket=source_bucket,
+                destination_bucket=destination_bucket,
+                prefix=prefix,
+                dry_run=dry_run,
+                use_acceleration=use_acceleration,
+                log_handle=log_handle,
+                command_template=command_template,
+                stop=stop,
+            )
+        if method == COPY_METHOD_ASYNC:
+            # Real async clones copy every prefix at once via _copy_prefixes_async.
+            return self._copy_prefix_async_dry_run(
+                source_bucket=source_bucket,
+                destination_bucket=destination_bucket,
+                prefix=prefix,
             )
+        if method == COPY_METHOD_S3_BATCH:
+            return self._copy_prefix_s3_batch(
+                source_bucket=source_bucket,
+                destination_bucket=destination_bucket,
+                prefix=prefix,
+                dry_run=dry_run,
+                destination_region=destination_region,
+                stop=stop,
+            )
+        return self._copy_prefix_boto3(
+            source_bucket=source_bucket,
+            destination_bucket=destination_bucket,
+            prefix=prefix,
+            dry_run=dry_run,
+            log_handle=log_handle,
+            executor=executor,
+            stop=stop,
+        )
 
-        if include_hg38:
-            for prefix in HG38_PREFIXES:
-                plan.append(
-                    CopyOperation(
-                        description=prefix.rstrip("/"),
-                        source_prefix=prefix,
-                        destination_prefix=prefix,
-                    )
-                )
+    def _copy_prefix_boto3(
+        self,
+        *,
+        source_bucket: str,
+        destination_bucket: str,
+        prefix: str,
+        dry_run: bool,
+        log_handle: TextIO | None,
+        request_payer: str = "requester",
+        executor: Executor | None = None,
+        stop: threading.Event | None = None,
+    ) -> int:
+        """Copy every object under *prefix* server-side and return the object count.
 
-        if include_b37:
-            for prefix in B37_PREFIXES:
-                plan.append(
-                    CopyOperation(
-                        description=prefix.rstrip("/"),
-                        source_prefix=prefix,
-                        destination_prefix=prefix,
-                    )
-                )
+        Copies are submitted to *executor* when given, so concurrent prefixes can
+        share one pool; otherwise a private pool is used for this prefix.  No
+        further copies are submitted once *stop* is set.
+        """
 
-        if include_giab:
-            for prefix in GIAB_PREFIXES:
-                plan.append(
-                    CopyOperation(
-                        description=prefix.rstrip("/"),
-                        source_prefix=prefix,
-                        destination_prefix=prefix,
+        if dry_run:
+            self.logger.info(
+                "[dry-run] Would copy s3://%s/%s to s3://%s/%s",
+                source_bucket,
+                prefix,
+                destination_bucket,
+                prefix,
+            )
+            return 0
+
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(Bucket=source_bucket, Prefix=prefix, RequestPayer=request_payer)
+        extra_args = {"RequestPayer": request_payer, "MetadataDirective": "REPLACE"}
+
+        def _copy(key: str) -> str:
+            # Server-side copies gain nothing from the accelerate endpoint, so
+            # both sides of the copy use the regular client.
+            self.s3_client.copy(
+                {"Bucket": source_bucket, "Key": key},
+                destination_bucket,
+                key,
+                ExtraArgs=extra_args,
+                SourceClient=self.s3_client,
+                Config=_COPY_TRANSFER_CONFIG,
+            )
+            return key
+
+        copied = 0
+
+        def _finish(future: Future) -> None:
+            nonlocal copied
+            key = future.result()
+            copied += 1
+            if log_handle:
+                with self._log_lock:
+                    log_handle.write(
+                        f"copy: s3://{source_bucket}/{key} "
+                        f"to s3://{destination_bucket}/{key}\n"
                     )
-                )
 
-        return plan
+        with contextlib.ExitStack() as stack:
+            if executor is None:
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=_COPY_WORKERS))
+            pending: Deque[Future] = deque()
+            try:
+                for page in pages:
+                    for item in page.get("Contents", ()):
+                        if stop is not None and stop.is_set():
+                            raise _CopyCancelled(f"copy of prefix {prefix!r} was stopped")
+                        if len(pending) >= _COPY_BACKLOG:
+                            _finish(pending.popleft())
+                        pending.append(executor.submit(_copy, item["Key"]))
+                while pending:
+                    _finish(pending.popleft())
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        self.logger.debug("Copied %d objects under %s", copied, prefix)
+        return copied
+
+    def _copy_prefix_async_dry_run(
+        self, *, source_bucket: str, destination_bucket: str, prefix: str
+    ) -> int:
+        """Log the copy an async clone would make of *prefix*; nothing is copied."""
 
-    def _run_copy_command(
+        self.logger.info(
+            "[dry-run] Would copy s3://%s/%s to s3://%s/%s",
+            source_bucket,
+            prefix,
+            destination_bucket,
+            prefix,
+        )
+        return 0
+
+    def _copy_prefixes_async(
+        self,
+        *,
+        source_bucket: str,
+        destination_bucket: str,
+        prefixes: Sequence[str],
+        log_handle: TextIO | None,
+        request_payer: str = "requester",
+    ) -> Dict[str, int]:
+        """Copy every object under *prefixes* with aioboto3 and return counts per prefix.
+
+        One event loop and one client serve all of *prefixes*.  A fixed pool of
+        ``_ASYNC_COPY_LIMIT`` worker coroutines drains a bounded queue fed by the
+        source listings, so memory does not grow with the size of a prefix.
+        """
+
+        copied = _run_coroutine(
+            self._copy_prefixes_aio(
+                source_bucket=source_bucket,
+                destination_bucket=destination_bucket,
+                prefixes=prefixes,
+                log_handle=log_handle,
+                request_payer=request_payer,
+            )
+        )
+        for prefix in prefixes:
+            self.logger.debug("Copied %d objects under %s", copied[prefix], prefix)
+        return copied
+
+    async def _copy_prefixes_aio(
+        self,
+        *,
+        source_bucket: str,
+        destination_bucket: str,
+        prefixes: Sequence[str],
+        log_handle: TextIO | None,
+        request_payer: str,
+    ) -> Dict[str, int]:
+        session = aioboto3.Session(profile_name=self.profile, region_name=self.region)
+        config = AioConfig(
+            max_pool_connections=_ASYNC_COPY_LIMIT, s3={"addressing_style": "virtual"}
+        )
+        extra_args = {"RequestPayer": request_payer, "MetadataDirective": "REPLACE"}
+        copied = dict.fromkeys(prefixes, 0)
+        errors: List[BaseException] = []
+        # Bounded so the listing never runs far ahead of the copies.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_ASYNC_COPY_LIMIT)
+
+        async with session.client("s3", config=config) as s3:
+
+            async def _worker() -> None:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    if errors:
+                        # Keep draining so the producer never blocks on a full queue.
+                        continue
+                    prefix, key, size = item
+                    copy_source = {"Bucket": source_bucket, "Key": key}
+                    try:
+                        if size > _MAX_COPY_OBJECT_BYTES:
+                            await s3.copy(
+                                copy_source,
+                                destination_bucket,
+                                key,
+                                ExtraArgs=extra_args,
+                                SourceClient=s3,
+                            )
+                        else:
+                            await s3.copy_object(
+                                Bucket=destination_bucket,
+                                Key=key,
+                                CopySource=copy_source,
+                                **extra_args,
+                            )
+                    except Exception as error:
+                        errors.append(error)
+                        continue
+                    copied[prefix] += 1
+                    if log_handle:
+                        with self._log_lock:
+                            log_handle.write(
+                                f"copy: s3://{source_bucket}/{key} "
+                                f"to s3://{destination_bucket}/{key}\n"
+                            )
+
+            workers = [asyncio.create_task(_worker()) for _ in range(_ASYNC_COPY_LIMIT)]
+            try:
+                paginator = s3.get_paginator("list_objects_v2")
+                for prefix in prefixes:
+                    if errors:
+                        break
+                    async for page in paginator.paginate(
+                        Bucket=source_bucket, Prefix=prefix, RequestPayer=request_payer
+                    ):
+                        for item in page.get("Contents", ()):
+                            await queue.put((prefix, item["Key"], item.get("Size", 0)))
+                        if errors:
+                            break
+                for _ in workers:
+                    await queue.put(None)
+                await asyncio.gather(*workers)
+            except BaseException:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+
+        if errors:
+            raise errors[0]
+        return copied
+
+    def _copy_prefix_s3_batch(
         self,
         *,
         source_bucket: str,
         destination_bucket: str,
         prefix: str,
         dry_run: bool,
-        use_acceleration: bool,
-        log_file: Path | None,
-        request_payer: str = "requester",
+        destination_region: str | None = None,
+        timeout: float = _BATCH_TIMEOUT_SECONDS,
+        stop: threading.Event | None = None,
+    ) -> int:
+        """Copy *prefix* with an S3 Batch Operations ``S3PutObjectCopy`` job.
+
+        A CSV manifest of the source keys is written under ``_manifests/`` in the
+        destination bucket, the job runs as :attr:`batch_role_arn` in
+        *destination_region* (the region of the manifest and report bucket), and
+        this method blocks until the job finishes.  A job still running after
+        *timeout* seconds, when the wait is interrupted or once *stop* is set,
+        is cancelled.  The
+        manifest is deleted afterwards.  Batch copies are limited to objects of
+        at most 5 GB; failures are reported under ``_manifests/reports``.
+        Returns the number of objects in the manifest.
+        """
+
+        destination_arn = f"arn:aws:s3:::{destination_bucket}"
+        manifest_key = f"{_BATCH_MANIFEST_PREFIX}{prefix.rstrip('/')}.csv"
+        if dry_run:
+            self.logger.info(
+                "[dry-run] Would submit an S3 Batch copy of s3://%s/%s to %s",
+                source_bucket,
+                prefix,
+                destination_arn,
+            )
+            return 0
+
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(Bucket=source_bucket, Prefix=prefix, RequestPayer="requester")
+        manifest = "".join(
+            f"{source_bucket},{quote(item['Key'], safe='/')}\n"
+            for page in pages
+            for item in page.get("Contents", ())
+        )
+        if not manifest:
+            self.logger.warning("No objects found under s3://%s/%s", source_bucket, prefix)
+            return 0
+
+        upload = self.s3_client.put_object(
+            Bucket=destination_bucket, Key=manifest_key, Body=manifest.encode("utf-8")
+        )
+        try:
+            self._run_s3_batch_job(
+                destination_arn=destination_arn,
+                manifest_key=manifest_key,
+                manifest_etag=upload["ETag"],
+                prefix=prefix,
+                region=destination_region or self.region,
+                timeout=timeout,
+                stop=stop,
+            )
+        finally:
+            self.s3_client.delete_object(Bucket=destination_bucket, Key=manifest_key)
+        return manifest.count("\n")
+
+    def _run_s3_batch_job(
+        self,
+        *,
+        destination_arn: str,
+        manifest_key: str,
+        manifest_etag: str,
+        prefix: str,
+        region: str | None,
+        timeout: float,
+        stop: threading.Event | None = None,
     ) -> None:
-        command = [
-            "aws",
-            "s3",
-            "cp",
-            f"s3://{source_bucket}/{prefix}",
-            f"s3://{destination_bucket}/{prefix}",
-            "--recursive",
-            "--request-payer",
-            request_payer,
-            "--metadata-directive",
-            "REPLACE",
-        ]
-
-        if use_acceleration:
-            command.extend(["--endpoint-url", "https://s3-accelerate.amazonaws.com"])
+        account_id = self._new_client("sts", region_name=region).get_caller_identity()["Account"]
+        s3control = self._new_client("s3control", region_name=region)
+        job = s3control.create_job(
+            AccountId=account_id,
+            ConfirmationRequired=False,
+            Operation={
+                "S3PutObjectCopy": {
+                    "TargetResource": destination_arn,
+                    "MetadataDirective": "REPLACE",
+                    "RequesterPays": True,
+                }
+            },
+            Manifest={
+                "Spec": {"Format": "S3BatchOperations_CSV_20180820", "Fields": ["Bucket", "Key"]},
+                "Location": {
+                    "ObjectArn": f"{destination_arn}/{manifest_key}",
+                    "ETag": manifest_etag,
+                },
+            },
+            Report={
+                "Bucket": destination_arn,
+                "Format": "Report_CSV_20180820",
+                "Enabled": True,
+                "Prefix": f"{_BATCH_MANIFEST_PREFIX}reports",
+                "ReportScope": "FailedTasksOnly",
+            },
+            ClientRequestToken=str(uuid.uuid4()),
+            Description=f"daylily-omics-references copy of {prefix}",
+            Priority=10,
+            RoleArn=self.batch_role_arn,
+        )
+        job_id = job["JobId"]
+        self.logger.info("Submitted S3 Batch job %s for %s", job_id, prefix)
+
+        # Worker threads never see KeyboardInterrupt, so the clone signals
+        # through *stop* instead.
+        if stop is None:
+            stop = threading.Event()
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                description = s3control.describe_job(AccountId=account_id, JobId=job_id)["Job"]
+                status = description["Status"]
+                if status in _BATCH_TERMINAL_STATUSES:
+                    break
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"S3 Batch job {job_id} for prefix {prefix!r} did not finish "
+                        f"within {timeout:.0f} seconds"
+                    )
+                if stop.wait(_BATCH_POLL_SECONDS):
+                    raise _CopyCancelled(f"S3 Batch job {job_id} for prefix {prefix!r} was stopped")
+        except (TimeoutError, KeyboardInterrupt, _CopyCancelled):
+            self.logger.warning("Cancelling S3 Batch job %s for %s", job_id, prefix)
+            s3control.update_job_status(
+                AccountId=account_id,
+                JobId=job_id,
+                RequestedJobStatus="Cancelled",
+                StatusUpdateReason="Cancelled by daylily-omics-references",
+            )
+            raise
+
+        failed = description.get("ProgressSummary", {}).get("NumberOfTasksFailed", 0)
+        if status != "Complete" or failed:
+            raise RuntimeError(
+                f"S3 Batch job {job_id} for prefix {prefix!r} ended with status {status} "
+                f"({failed} failed tasks)"
+            )
+
+    @functools.cached_property
+    def _child_env(self) -> Dict[str, str]:
+        """Environment for ``aws`` subprocesses, built once per manager."""
 
         env = os.environ.copy()
         if self.profile:
             env["AWS_PROFILE"] = self.profile
+        return env
+
+    def _run_copy_command(
+        self,
+        *,
+        source_bucket: str,
+        destination_bucket: str,
+        prefix: str,
+        dry_run: bool,
+        use_acceleration: bool,
+        log_handle: TextIO | None,
+        request_payer: str = "requester",
+        command_template: Sequence[str] | None = None,
+        stop: threading.Event | None = None,
+    ) -> int:
+        """Run ``aws s3 cp`` for *prefix* and return how many objects it reported copying.
+
+        The command is not started once *stop* is set.
+        """
+
+        if command_template is None:
+            command_template = _copy_command_template(
+                request_payer=request_payer, use_acceleration=use_acceleration
+            )
+        # Only the source and destination URIs vary between prefixes.
+        command = list(command_template)
+        command[3] = f"s3://{source_bucket}/{prefix}"
+        command[4] = f"s3://{destination_bucket}/{prefix}"
 
         if dry_run:
             self.logger.info("[dry-run] %s", " ".join(shlex.quote(part) for part in command))
-            return
+            return 0
 
-        if log_file:
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            with log_file.open("a", encoding="utf-8") as handle:
-                handle.write(f"$ {' '.join(shlex.quote(part) for part in command)}\n")
-
-        self.logger.debug("Running command: %s", " ".join(command))
+        if stop is not None and stop.is_set():
+            raise _CopyCancelled(f"copy of prefix {prefix!r} was stopped")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Running command: %s", " ".join(command))
         result = self.command_runner(
             command,
             check=False,
             capture_output=True,
             text=True,
-            env=env,
+            env=self._child_env,
         )
 
-        if log_file:
-            with log_file.open("a", encoding="utf-8") as handle:
+        if log_handle:
+            # Write the command and its output together so concurrent copies
+            # don't interleave within one command's block.
+            with self._log_lock:
+                log_handle.write(f"$ {' '.join(shlex.quote(part) for part in command)}\n")
                 if result.stdout:
-                    handle.write(result.stdout)
+                    log_handle.write(result.stdout)
                 if result.stderr:
-                    handle.write(result.stderr)
+                    log_handle.write(result.stderr)
 
         if result.returncode != 0:
             raise RuntimeError(
                 f"aws s3 cp for prefix {prefix!r} failed with code {result.returncode}: {result.stderr}"
             )
+        # The CLI prints one "copy: <source> to <destination>" line per object.
+        return (result.stdout or "").count("copy: s3://")
 
     # ------------------------------------------------------------------
     # Public API
@@ -292,51 +1067,157 @@ class ReferenceBucketManager:
         include_giab: bool = True,
         use_acceleration: bool = False,
         log_file: str | None = None,
+        include_mask: int | None = None,
+        method: str = DEFAULT_COPY_METHOD,
+        known_missing: bool = False,
     ) -> str:
-        """Clone reference data into a new bucket and return the bucket name."""
+        """Clone reference data into a new bucket and return the bucket name.
+
+        ``include_mask`` is an ``INCLUDE_*`` bit mask that, when given, takes
+        precedence over the individual ``include_*`` flags.  ``method`` selects
+        server-side copies through boto3 (the default), the legacy ``aws s3 cp``
+        subprocess, or S3 Batch Operations jobs (which require
+        :attr:`batch_role_arn` and otherwise fall back to boto3); ``"async"``
+        issues the boto3 copies through aioboto3 when it is installed.
+        ``use_acceleration`` only affects the AWS CLI method.  Callers that have
+        just checked the bucket is absent pass ``known_missing=True`` to skip
+        probing it again.
+        """
 
         if version not in SOURCE_BUCKET_BY_VERSION:
             raise ValueError(f"Unsupported reference version: {version}")
+        if method not in COPY_METHODS:
+            raise ValueError(f"Unsupported copy method: {method}")
+        if method == COPY_METHOD_S3_BATCH and not self.batch_role_arn:
+            self.logger.warning(
+                "No batch role ARN configured; falling back to the %s copy method",
+                COPY_METHOD_BOTO3,
+            )
+            method = COPY_METHOD_BOTO3
+        if method == COPY_METHOD_ASYNC and aioboto3 is None:
+            self.logger.warning(
+                "aioboto3 is not installed; falling back to the %s copy method",
+                COPY_METHOD_BOTO3,
+            )
+            method = COPY_METHOD_BOTO3
+        if use_acceleration and method != COPY_METHOD_CLI:
+            self.logger.warning(
+                "S3 acceleration only applies to the %s copy method; ignoring it for %s",
+                COPY_METHOD_CLI,
+                method,
+            )
 
         source_bucket = SOURCE_BUCKET_BY_VERSION[version]
         bucket_name = f"{bucket_prefix}-omics-analysis-{region}"
         log_path = Path(log_file) if log_file else None
 
-        if self.bucket_exists(bucket_name):
+        if not known_missing and self.bucket_exists(bucket_name):
             raise ValueError(f"Bucket '{bucket_name}' already exists")
 
         # Create bucket (and optionally enable acceleration)
         self.create_bucket(bucket_name, region, dry_run=dry_run)
 
-        plan = self._build_copy_plan(
-            include_hg38=include_hg38,
-            include_b37=include_b37,
-            include_giab=include_giab,
-        )
+        mask = _include_mask(include_mask, include_hg38, include_b37, include_giab)
+        plan = self._build_copy_plan(include_mask=mask)
 
         if dry_run:
             self.logger.info(
                 "[dry-run] Would copy version marker %s to %s", VERSION_INFO_KEY, bucket_name
             )
         else:
-            self.write_version_file(bucket_name, version, dry_run=False)
+            self.write_version_file(bucket_name, version, dry_run=False, include_mask=mask)
 
+        # The plan only ever holds prefixes selected by the include mask.
         total_ops = len(plan)
-        for index, operation in enumerate(plan, start=1):
-            if not operation.include:
-                continue
-            self.logger.info(
-                "Copying %s (%d/%d)", operation.description, index, total_ops
-            )
-            self._run_copy_command(
-                source_bucket=source_bucket,
-                destination_bucket=bucket_name,
-                prefix=operation.source_prefix,
-                dry_run=dry_run,
-                use_acceleration=use_acceleration,
-                log_file=log_path,
+        operations = list(enumerate(plan, start=1))
+
+        command_template = None
+        if method == COPY_METHOD_CLI:
+            command_template = _copy_command_template(
+                request_payer="requester", use_acceleration=use_acceleration
             )
 
+        prefix_workers = min(
+            _env_int(_PREFIX_CONCURRENCY_ENV, _MAX_PREFIX_CONCURRENCY), len(operations)
+        )
+        with contextlib.ExitStack() as stack:
+            # The log is opened once for the whole clone and shared, under
+            # self._log_lock, by every copy.
+            log_handle: TextIO | None = None
+            if log_path and not dry_run:
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+                log_handle = stack.enter_context(
+                    log_path.open("a", encoding="utf-8", buffering=_LOG_BUFFER_SIZE)
+                )
+
+            # Set when the clone is abandoned, so copies still running stop early.
+            stop = threading.Event()
+
+            def _copy(index: int, operation: CopyOperation, executor: Executor | None) -> None:
+                if stop.is_set():
+                    return
+                self.logger.info(
+                    "Copying %s (%d/%d)", operation.description, index, total_ops
+                )
+                copied = self._copy_prefix(
+                    method=method,
+                    source_bucket=source_bucket,
+                    destination_bucket=bucket_name,
+                    prefix=operation.source_prefix,
+                    dry_run=dry_run,
+                    use_acceleration=use_acceleration,
+                    log_handle=log_handle,
+                    executor=executor,
+                    command_template=command_template,
+                    destination_region=region,
+                    stop=stop,
+                )
+                # An empty copy leaves nothing for the sentinel to vouch for.
+                if not dry_run and copied:
+                    self._write_prefix_sentinel(bucket_name, operation.destination_prefix)
+
+            if method == COPY_METHOD_ASYNC and not dry_run:
+                # One event loop and client copy every prefix.
+                self.logger.info("Copying %d prefixes with aioboto3", total_ops)
+                copied_by_prefix = self._copy_prefixes_async(
+                    source_bucket=source_bucket,
+                    destination_bucket=bucket_name,
+                    prefixes=[operation.source_prefix for _, operation in operations],
+                    log_handle=log_handle,
+                )
+                for _, operation in operations:
+                    if copied_by_prefix.get(operation.source_prefix):
+                        self._write_prefix_sentinel(bucket_name, operation.destination_prefix)
+            elif dry_run or prefix_workers <= 1:
+                # Nothing to overlap; keep the output in plan order.
+                for index, operation in operations:
+                    _copy(index, operation, None)
+            else:
+                # Prefixes share a single object-copy pool rather than each
+                # starting their own.
+                object_executor = None
+                if method == COPY_METHOD_BOTO3:
+                    object_executor = stack.enter_context(
+                        ThreadPoolExecutor(max_workers=_COPY_WORKERS)
+                    )
+                prefix_executor = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=prefix_workers)
+                )
+                futures = [
+                    prefix_executor.submit(_copy, index, operation, object_executor)
+                    for index, operation in operations
+                ]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    # KeyboardInterrupt only reaches this thread; the workers
+                    # learn of it, or of a failed prefix, through *stop*.
+                    stop.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
+
         self.logger.info("Bucket %s is ready", bucket_name)
         return bucket_name
 
@@ -348,36 +1229,78 @@ class ReferenceBucketManager:
         include_hg38: bool = True,
         include_b37: bool = True,
         include_giab: bool = True,
+        include_mask: int | None = None,
+        expected_keys: Iterable[str] | None = None,
     ) -> None:
-        """Verify that *bucket* contains the expected structure and version."""
+        """Verify that *bucket* contains the expected structure and version.
+
+        ``include_mask`` behaves as in :meth:`clone_reference_bucket`.  Passing
+        ``expected_keys`` (a manifest of object keys) additionally lists each
+        checked prefix in full and reports every listed key that is missing.
+        """
 
         if expected_version not in SOURCE_BUCKET_BY_VERSION:
             raise ValueError(f"Unsupported reference version: {expected_version}")
 
-        if not self.bucket_exists(bucket):
-            raise BucketVerificationError(bucket, ["bucket does not exist"])
+        self._verify_bucket(
+            bucket,
+            expected_version=expected_version,
+            include_mask=_include_mask(include_mask, include_hg38, include_b37, include_giab),
+            marker=self._read_version_marker(bucket),
+            expected_keys=expected_keys,
+        )
+
+    def _verify_bucket(
+        self,
+        bucket: str,
+        *,
+        expected_version: str,
+        include_mask: int,
+        marker: Tuple[str, Dict[str, str]] | None,
+        expected_keys: Iterable[str] | None = None,
+    ) -> None:
+        """Verify *bucket* given the result of :meth:`_read_version_marker`."""
 
         issues: List[str] = []
-        bucket_version = self.read_bucket_version(bucket)
-        if bucket_version is None:
+        if marker is None:
+            # Only an unreadable marker leaves the bucket's existence open.
+            if not self.bucket_exists(bucket):
+                raise BucketVerificationError(bucket, ["bucket does not exist"])
             issues.append("missing version marker")
-        elif bucket_version != expected_version:
-            issues.append(
-                f"version mismatch (expected {expected_version}, found {bucket_version})"
-            )
-
-        prefixes_to_check: List[str] = list(CORE_PREFIXES)
-        if include_hg38:
-            prefixes_to_check.extend(HG38_PREFIXES)
-        if include_b37:
-            prefixes_to_check.extend(B37_PREFIXES)
-        if include_giab:
-            prefixes_to_check.extend(GIAB_PREFIXES)
-
+        else:
+            bucket_version, metadata = marker
+            if bucket_version != expected_version:
+                issues.append(
+                    f"version mismatch (expected {expected_version}, found {bucket_version})"
+                )
+            # Markers written before the include flags were recorded carry none.
+            for bit, name in _INCLUDE_NAMES:
+                if include_mask & bit and metadata.get(f"include-{name}") == "0":
+                    issues.append(f"{name} references were excluded when the bucket was cloned")
+
+        prefixes_to_check = _PREFIXES_BY_MASK[include_mask & INCLUDE_ALL]
+
+        deep = expected_keys is not None
+        # Buckets cloned before sentinels were written would miss every probe.
+        sentinels = marker is not None and marker[1].get("sentinels") == "1"
+        found = self._find_prefixes(
+            bucket, prefixes_to_check, sentinels=sentinels, remember_cursors=deep
+        )
         for prefix in prefixes_to_check:
-            if not self._prefix_exists(bucket, prefix):
+            if prefix not in found:
                 issues.append(f"missing objects under {prefix}")
 
+        if deep:
+            try:
+                for key in self._missing_keys(bucket, prefixes_to_check, found, expected_keys):
+                    issues.append(f"missing object {key}")
+            finally:
+                # Prefixes without manifest keys were never resumed; drop their
+                # cursors so a later deep verify lists them afresh.
+                with self._cursor_lock:
+                    for prefix in prefixes_to_check:
+                        self._listing_cursors.pop((bucket, prefix), None)
+
         if issues:
             raise BucketVerificationError(bucket, issues)
 
@@ -388,13 +1311,176 @@ class ReferenceBucketManager:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _prefix_exists(self, bucket: str, prefix: str) -> bool:
+    def _map(self, func: Callable[[str, str], _T], bucket: str, items: Sequence[str]) -> List[_T]:
+        """Return ``func(bucket, item)`` for each item, using up to ``verify_workers`` threads."""
+
+        workers = min(self.verify_workers, len(items))
+        if workers <= 1:
+            return [func(bucket, item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, repeat(bucket), items))
+
+    def _find_prefixes(
+        self,
+        bucket: str,
+        prefixes: Sequence[str],
+        *,
+        sentinels: bool = False,
+        remember_cursors: bool = False,
+    ) -> Set[str]:
+        """Return the subset of *prefixes* that contain objects in *bucket*.
+
+        With *sentinels* (and :attr:`use_sentinel`), prefix sentinels are probed
+        before listing.  With *remember_cursors*, listing probes keep their
+        continuation tokens for :meth:`_list_prefix_keys`.
+        """
+
+        found = {prefix for prefix in prefixes if (bucket, prefix) in self._prefix_cache}
+        pending = [prefix for prefix in prefixes if prefix not in found]
+
+        if pending and sentinels and self.use_sentinel:
+            hits = self._map(self._sentinel_exists, bucket, pending)
+            found.update(prefix for prefix, hit in zip(pending, hits) if hit)
+            # Prefixes that copied nothing or failed part-way have no sentinel.
+            pending = [prefix for prefix, hit in zip(pending, hits) if not hit]
+
+        if len(pending) >= _BULK_PREFIX_THRESHOLD:
+            found.update(
+                self._bulk_prefix_exists(bucket, pending, remember_cursors=remember_cursors)
+            )
+        elif pending:
+            probe = functools.partial(self._prefix_has_objects, remember_cursor=remember_cursors)
+            hits = self._map(probe, bucket, pending)
+            found.update(prefix for prefix, hit in zip(pending, hits) if hit)
+
+        self._prefix_cache.update((bucket, prefix) for prefix in found)
+        return found
+
+    def _sentinel_exists(self, bucket: str, prefix: str) -> bool:
+        try:
+            self.s3_client.head_object(Bucket=bucket, Key=f"{prefix}{PREFIX_SENTINEL_NAME}")
+        except ClientError:
+            return False
+        return True
+
+    def _prefix_has_objects(
+        self, bucket: str, prefix: str, *, remember_cursor: bool = False
+    ) -> bool:
+        """Return whether *prefix* holds objects, listing a single key.
+
+        With *remember_cursor*, a truncated listing's continuation token is
+        kept for :meth:`_list_prefix_keys`.
+        """
+
         response = self.s3_client.list_objects_v2(
             Bucket=bucket,
             Prefix=prefix,
             MaxKeys=1,
+            FetchOwner=False,
         )
-        return "Contents" in response and bool(response["Contents"])
+        contents = response.get("Contents") or ()
+        if remember_cursor and response.get("IsTruncated"):
+            with self._cursor_lock:
+                self._listing_cursors[(bucket, prefix)] = (
+                    tuple(item["Key"] for item in contents),
+                    response["NextContinuationToken"],
+                )
+        return bool(contents)
+
+    def _list_prefix_keys(self, bucket: str, prefix: str) -> Set[str]:
+        """Return every key under *prefix*, resuming an earlier probe if possible."""
+
+        keys: Set[str] = set()
+        params = {"Bucket": bucket, "Prefix": prefix, "MaxKeys": 1000, "FetchOwner": False}
+        with self._cursor_lock:
+            cursor = self._listing_cursors.pop((bucket, prefix), None)
+        if cursor is not None:
+            seen, token = cursor
+            keys.update(seen)
+            params["ContinuationToken"] = token
+        while True:
+            response = self.s3_client.list_objects_v2(**params)
+            keys.update(item["Key"] for item in response.get("Contents", ()))
+            if not response.get("IsTruncated"):
+                return keys
+            params["ContinuationToken"] = response["NextContinuationToken"]
+
+    def _missing_keys(
+        self,
+        bucket: str,
+        prefixes: Sequence[str],
+        found: Set[str],
+        expected_keys: Iterable[str],
+    ) -> List[str]:
+        """Return the *expected_keys* under *prefixes* that are absent from *bucket*.
+
+        Only prefixes in *found* are listed; empty ones are reported by the
+        caller.  Keys outside every prefix in *prefixes* are logged and skipped.
+        """
+
+        by_prefix: Dict[str, Set[str]] = {}
+        unchecked: List[str] = []
+        for key in expected_keys:
+            for prefix in prefixes:
+                if key.startswith(prefix):
+                    by_prefix.setdefault(prefix, set()).add(key)
+                    break
+            else:
+                unchecked.append(key)
+        if unchecked:
+            self.logger.warning(
+                "Not checking %d manifest key(s) outside the verified prefixes: %s",
+                len(unchecked),
+                ", ".join(sorted(unchecked)),
+            )
+
+        checked = [prefix for prefix in by_prefix if prefix in found]
+        missing: List[str] = []
+        for prefix, listed in zip(checked, self._map(self._list_prefix_keys, bucket, checked)):
+            missing.extend(by_prefix[prefix] - listed)
+        return sorted(missing)
+
+    def _bulk_prefix_exists(
+        self, bucket: str, prefixes: Sequence[str], *, remember_cursors: bool = False
+    ) -> Set[str]:
+        """Return the subset of *prefixes* that contain objects in *bucket*.
+
+        Prefixes are grouped by parent "directory" and each parent is listed once
+        with ``Delimiter="/"``; S3 reports a common prefix only when some object
+        lives under it.  This avoids walking the (very large) objects themselves.
+        """
+
+        by_parent: Dict[str, Set[str]] = {}
+        singles: List[str] = []
+        for prefix in prefixes:
+            if not prefix.endswith("/"):
+                singles.append(prefix)
+                continue
+            parent = prefix[: prefix.rfind("/", 0, -1) + 1]
+            by_parent.setdefault(parent, set()).add(prefix)
+
+        def _list_parent(bucket: str, parent: str) -> Set[str]:
+            wanted = set(by_parent[parent])
+            seen: Set[str] = set()
+            params = {"Bucket": bucket, "Prefix": parent, "Delimiter": "/", "MaxKeys": 1000}
+            while wanted:
+                response = self.s3_client.list_objects_v2(**params)
+                for entry in response.get("CommonPrefixes", ()):
+                    if entry["Prefix"] in wanted:
+                        wanted.discard(entry["Prefix"])
+                        seen.add(entry["Prefix"])
+                if not response.get("IsTruncated"):
+                    break
+                params["ContinuationToken"] = response["NextContinuationToken"]
+            return seen
+
+        found: Set[str] = set()
+        for seen in self._map(_list_parent, bucket, list(by_parent)):
+            found |= seen
+        probe = functools.partial(self._prefix_has_objects, remember_cursor=remember_cursors)
+        hits = self._map(probe, bucket, singles)
+        found.update(prefix for prefix, hit in zip(singles, hits) if hit)
+        return found
 
     # ------------------------------------------------------------------
     def ensure_bucket(
@@ -410,18 +1496,29 @@ class ReferenceBucketManager:
         log_file: str | None = None,
         dry_run: bool = False,
         create_missing: bool = True,
+        include_mask: int | None = None,
+        method: str = DEFAULT_COPY_METHOD,
     ) -> str:
-        """Ensure a bucket exists and matches the expected structure."""
+        """Ensure a bucket exists and matches the expected structure.
+
+        ``include_mask`` and ``method`` behave as in :meth:`clone_reference_bucket`.
+        """
+
+        if version not in SOURCE_BUCKET_BY_VERSION:
+            raise ValueError(f"Unsupported reference version: {version}")
 
+        mask = _include_mask(include_mask, include_hg38, include_b37, include_giab)
         bucket_name = f"{bucket_prefix}-omics-analysis-{region}"
-        if self.bucket_exists(bucket_name):
+        # Reading the version marker answers both whether the bucket exists and
+        # which version it holds; only a failed read needs a HeadBucket.
+        marker = self._read_version_marker(bucket_name)
+        if marker is not None or self.bucket_exists(bucket_name):
             self.logger.debug("Bucket %s already exists, verifying", bucket_name)
-            self.verify_bucket(
+            self._verify_bucket(
                 bucket_name,
                 expected_version=version,
-                include_hg38=include_hg38,
-                include_b37=include_b37,
-                include_giab=include_giab,
+                include_mask=mask,
+                marker=marker,
             )
             return bucket_name
 
@@ -436,9 +1533,9 @@ class ReferenceBucketManager:
             region=region,
             version=version,
             dry_run=dry_run,
-            include_hg38=include_hg38,
-            include_b37=include_b37,
-            include_giab=include_giab,
             use_acceleration=use_acceleration,
             log_file=log_file,
+            include_mask=mask,
+            method=method,
+            known_missing=True,
         )
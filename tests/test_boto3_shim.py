@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import boto3
+import pytest
+
+
+@pytest.mark.parametrize(
+    "body,expected",
+    [
+        (memoryview(b"abcd"), b"abcd"),
+        (memoryview(b"abcd")[::-1], b"dcba"),
+        (memoryview(b"abcdef")[::2], b"ace"),
+        (memoryview(bytearray(b"abcd")), b"abcd"),
+    ],
+)
+def test_put_object_stores_memoryview_bytes_in_view_order(body, expected):
+    client = boto3.session.Session(region_name="us-west-2").client("s3")
+    client.create_bucket(Bucket="target")
+
+    client.put_object(Bucket="target", Key="key", Body=body)
+
+    assert client.get_object(Bucket="target", Key="key")["Body"].read() == expected
@@ -1,37 +1,69 @@
 from __future__ import annotations
 
+import asyncio
 import io
+import threading
 from unittest import mock
 
 import boto3
 import pytest
+from botocore.config import Config
 from botocore.response import StreamingBody
 from botocore.stub import Stubber
 from botocore.exceptions import ClientError
 
 from daylily_omics_references import BucketVerificationError, ReferenceBucketManager
+from daylily_omics_references import manager as manager_module
 from daylily_omics_references.constants import (
     B37_PREFIXES,
     CORE_PREFIXES,
     DEFAULT_REFERENCE_VERSION,
     GIAB_PREFIXES,
     HG38_PREFIXES,
+    INCLUDE_ALL,
+    INCLUDE_GIAB,
+    INCLUDE_HG38,
     VERSION_INFO_KEY,
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_default_clients():
+    # Default managers share cached clients; with the in-memory S3 stand-in
+    # those carry buckets between tests unless the cache is cleared.
+    manager_module._default_s3_client.cache_clear()
+    yield
+    manager_module._default_s3_client.cache_clear()
+
+
 def _version_body(version: str) -> StreamingBody:
     data = version.encode("utf-8")
     return StreamingBody(io.BytesIO(data), len(data))
 
 
+def _add_prefix_listings(stubber: Stubber, bucket: str, prefixes, missing=()) -> None:
+    """Queue the delimited parent listings verify_bucket issues for *prefixes*."""
+
+    by_parent = {}
+    for prefix in prefixes:
+        parent = prefix[: prefix.rfind("/", 0, -1) + 1]
+        by_parent.setdefault(parent, []).append(prefix)
+    for parent, children in by_parent.items():
+        present = [{"Prefix": child} for child in children if child not in missing]
+        stubber.add_response(
+            "list_objects_v2",
+            {"CommonPrefixes": present} if present else {},
+            {"Bucket": bucket, "Prefix": parent, "Delimiter": "/", "MaxKeys": 1000},
+        )
+
+
 def test_clone_reference_bucket_dry_run():
     manager = ReferenceBucketManager()
 
     with mock.patch.object(manager, "bucket_exists", return_value=False), \
         mock.patch.object(manager, "create_bucket") as mock_create, \
         mock.patch.object(manager, "write_version_file") as mock_write, \
-        mock.patch.object(manager, "_run_copy_command") as mock_copy:
+        mock.patch.object(manager, "_copy_prefix") as mock_copy:
         bucket = manager.clone_reference_bucket(
             bucket_prefix="test",
             region="us-west-2",
@@ -45,6 +77,24 @@ def test_clone_reference_bucket_dry_run():
     assert mock_copy.call_count == expected_calls
 
 
+def test_clone_reference_bucket_include_mask_overrides_flags():
+    manager = ReferenceBucketManager()
+
+    with mock.patch.object(manager, "bucket_exists", return_value=False), \
+        mock.patch.object(manager, "create_bucket"), \
+        mock.patch.object(manager, "_copy_prefix") as mock_copy:
+        manager.clone_reference_bucket(
+            bucket_prefix="test",
+            region="us-west-2",
+            dry_run=True,
+            include_b37=True,
+            include_mask=INCLUDE_HG38 | INCLUDE_GIAB,
+        )
+
+    copied = [call.kwargs["prefix"] for call in mock_copy.call_args_list]
+    assert copied == list(CORE_PREFIXES) + list(HG38_PREFIXES) + list(GIAB_PREFIXES)
+
+
 @pytest.mark.parametrize(
     "include_hg38,include_b37,include_giab",
     [
@@ -55,7 +105,11 @@ def test_clone_reference_bucket_dry_run():
 def test_verify_bucket_success(include_hg38: bool, include_b37: bool, include_giab: bool):
     session = boto3.session.Session(region_name="us-west-2")
     client = session.client("s3")
-    manager = ReferenceBucketManager(session=session, s3_client=client)
+    # Stubbed responses are consumed in order, so probe prefixes sequentially,
+    # and exercise the listing path rather than sentinel lookups.
+    manager = ReferenceBucketManager(
+        session=session, s3_client=client, verify_workers=1, use_sentinel=False
+    )
     stubber = Stubber(client)
 
     prefixes = list(CORE_PREFIXES)
@@ -67,18 +121,13 @@ def test_verify_bucket_success(include_hg38: bool, include_b37: bool, include_gi
         prefixes.extend(GIAB_PREFIXES)
 
     with stubber:
-        stubber.add_response("head_bucket", {}, {"Bucket": "target"})
+        # A readable version marker proves the bucket exists; no head_bucket.
         stubber.add_response(
             "get_object",
             {"Body": _version_body(DEFAULT_REFERENCE_VERSION)},
-            {"Bucket": "target", "Key": VERSION_INFO_KEY},
+            {"Bucket": "target", "Key": VERSION_INFO_KEY, "Range": "bytes=0-63"},
         )
-        for prefix in prefixes:
-            stubber.add_response(
-                "list_objects_v2",
-                {"Contents": [{"Key": f"{prefix}dummy"}]},
-                {"Bucket": "target", "Prefix": prefix, "MaxKeys": 1},
-            )
+        _add_prefix_listings(stubber, "target", prefixes)
 
         manager.verify_bucket(
             "target",
@@ -88,37 +137,88 @@ def test_verify_bucket_success(include_hg38: bool, include_b37: bool, include_gi
         )
 
 
-def test_verify_bucket_missing_prefix():
+def test_verify_bucket_reports_subsets_excluded_at_clone_time():
+    session = boto3.session.Session(region_name="us-west-2")
+    client = session.client("s3")
+    manager = ReferenceBucketManager(
+        session=session, s3_client=client, verify_workers=1, use_sentinel=False
+    )
+    stubber = Stubber(client)
+    prefixes = list(CORE_PREFIXES) + list(HG38_PREFIXES) + list(GIAB_PREFIXES)
+
+    with stubber:
+        stubber.add_response(
+            "get_object",
+            {
+                "Body": _version_body(DEFAULT_REFERENCE_VERSION),
+                "Metadata": {
+                    "version": DEFAULT_REFERENCE_VERSION,
+                    "include-hg38": "1",
+                    "include-b37": "0",
+                    "include-giab": "0",
+                },
+            },
+            {"Bucket": "target", "Key": VERSION_INFO_KEY, "Range": "bytes=0-63"},
+        )
+        _add_prefix_listings(stubber, "target", prefixes)
+
+        with pytest.raises(BucketVerificationError) as exc:
+            manager.verify_bucket("target", include_b37=False)
+
+    assert exc.value.issues == ["giab references were excluded when the bucket was cloned"]
+
+
+def test_write_version_file_records_metadata():
     session = boto3.session.Session(region_name="us-west-2")
     client = session.client("s3")
+    client.create_bucket(Bucket="target")
     manager = ReferenceBucketManager(session=session, s3_client=client)
+
+    manager.write_version_file("target", DEFAULT_REFERENCE_VERSION, include_mask=INCLUDE_HG38)
+
+    assert manager.read_bucket_version("target") == DEFAULT_REFERENCE_VERSION
+    assert manager.read_bucket_metadata("target") == {
+        "version": DEFAULT_REFERENCE_VERSION,
+        "sentinels": "1",
+        "include-hg38": "1",
+        "include-b37": "0",
+        "include-giab": "0",
+    }
+
+
+def test_read_bucket_metadata_returns_a_copy():
+    session = boto3.session.Session(region_name="us-west-2")
+    client = session.client("s3")
+    client.create_bucket(Bucket="target")
+    manager = ReferenceBucketManager(session=session, s3_client=client)
+    manager.write_version_file("target", DEFAULT_REFERENCE_VERSION, include_mask=INCLUDE_HG38)
+
+    manager.read_bucket_metadata("target")["include-b37"] = "1"
+
+    assert manager.read_bucket_metadata("target")["include-b37"] == "0"
+
+
+def test_verify_bucket_missing_prefix():
+    session = boto3.session.Session(region_name="us-west-2")
+    client = session.client("s3")
+    # Stubbed responses are consumed in order, so probe prefixes sequentially,
+    # and exercise the listing path rather than sentinel lookups.
+    manager = ReferenceBucketManager(
+        session=session, s3_client=client, verify_workers=1, use_sentinel=False
+    )
     stubber = Stubber(client)
 
     prefixes = list(CORE_PREFIXES) + list(HG38_PREFIXES) + list(B37_PREFIXES) + list(GIAB_PREFIXES)
 
     with stubber:
-        stubber.add_response("head_bucket", {}, {"Bucket": "target"})
+        # A readable version marker proves the bucket exists; no head_bucket.
         stubber.add_response(
             "get_object",
             {"Body": _version_body(DEFAULT_REFERENCE_VERSION)},
-            {"Bucket": "target", "Key": VERSION_INFO_KEY},
-        )
-
-        first = True
-        for prefix in prefixes:
-            if first:
-                stubber.add_response(
-                    "list_objects_v2",
-                    {},
-                    {"Bucket": "target", "Prefix": prefix, "MaxKeys": 1},
-                )
-                first = False
-            else:
-                stubber.add_response(
-                    "list_objects_v2",
-                    {"Contents": [{"Key": f"{prefix}dummy"}]},
-                    {"Bucket": "target", "Prefix": prefix, "MaxKeys": 1},
-                )
+            {"Bucket": "target", "Key": VERSION_INFO_KEY, "Range": "bytes=0-63"},
+        )
+
+        _add_prefix_listings(stubber, "target", prefixes, missing={prefixes[0]})
 
         with pytest.raises(BucketVerificationError) as exc:
             manager.verify_bucket("target")
@@ -126,6 +226,118 @@ def test_verify_bucket_missing_prefix():
     assert "missing objects" in str(exc.value)
 
 
+def _reference_bucket(session, bucket: str, prefixes):
+    client = session.client("s3")
+    client.create_bucket(Bucket=bucket)
+    for prefix in prefixes:
+        client.put_object(Bucket=bucket, Key=f"{prefix}a", Body=b"a")
+    client.put_object(Bucket=bucket, Key=VERSION_INFO_KEY, Body=DEFAULT_REFERENCE_VERSION)
+    return client
+
+
+def test_deep_probe_resumes_listing():
+    session = boto3.session.Session(region_name="us-west-2")
+    client = _reference_bucket(session, "target", ["data/lib/"])
+    client.put_object(Bucket="target", Key="data/lib/b", Body=b"b")
+    manager = ReferenceBucketManager(session=session, s3_client=client)
+
+    assert manager._prefix_has_objects("target", "data/lib/")
+    assert not manager._listing_cursors
+    assert manager._prefix_has_objects("target", "data/lib/", remember_cursor=True)
+    with mock.patch.object(
+        type(client), "list_objects_v2", autospec=True, side_effect=type(client).list_objects_v2
+    ) as mock_list:
+        keys = manager._list_prefix_keys("target", "data/lib/")
+
+    assert keys == {"data/lib/a", "data/lib/b"}
+    assert mock_list.call_args.kwargs["ContinuationToken"] == "data/lib/a"
+    assert not manager._prefix_has_objects("target", "data/other/", remember_cursor=True)
+
+
+def test_verify_bucket_reports_keys_missing_from_manifest():
+    session = boto3.session.Session(region_name="us-west-2")
+    prefixes = list(CORE_PREFIXES) + list(HG38_PREFIXES) + list(B37_PREFIXES) + list(GIAB_PREFIXES)
+    client = _reference_bucket(session, "target", prefixes)
+    manager = ReferenceBucketManager(session=session, s3_client=client, use_sentinel=False)
+
+    manifest = [f"{prefixes[0]}a", f"{prefixes[1]}a"]
+    manager.verify_bucket("target", expected_keys=manifest)
+
+    with pytest.raises(BucketVerificationError) as exc:
+        manager.verify_bucket("target", expected_keys=manifest + [f"{prefixes[1]}gone"])
+
+    assert exc.value.issues == [f"missing object {prefixes[1]}gone"]
+
+
+def test_deep_verify_drops_cursors_it_did_not_resume():
+    session = boto3.session.Session(region_name="us-west-2")
+    prefixes = list(CORE_PREFIXES) + list(HG38_PREFIXES) + list(B37_PREFIXES) + list(GIAB_PREFIXES)
+    client = _reference_bucket(session, "target", prefixes)
+    for prefix in prefixes:
+        client.put_object(Bucket="target", Key=f"{prefix}b", Body=b"b")
+    manager = ReferenceBucketManager(session=session, s3_client=client, use_sentinel=False)
+
+    # Probe every prefix with a truncated single-key listing; the manifest
+    # only covers the last one.
+    with mock.patch.object(manager_module, "_BULK_PREFIX_THRESHOLD", len(prefixes) + 1):
+        manager.verify_bucket("target", expected_keys=[f"{prefixes[-1]}a"])
+
+    assert not manager._listing_cursors
+
+
+def test_verify_bucket_logs_manifest_keys_outside_checked_prefixes(caplog):
+    session = boto3.session.Session(region_name="us-west-2")
+    prefixes = list(CORE_PREFIXES) + list(HG38_PREFIXES)
+    client = _reference_bucket(session, "target", prefixes)
+    manager = ReferenceBucketManager(session=session, s3_client=client, use_sentinel=False)
+
+    manifest = [f"{prefixes[0]}a", f"{B37_PREFIXES[0]}a"]
+    with caplog.at_level("WARNING", logger=manager.logger.name):
+        manager.verify_bucket(
+            "target", include_b37=False, include_giab=False, expected_keys=manifest
+        )
+
+    assert f"{B37_PREFIXES[0]}a" in caplog.text
+
+
+def test_read_bucket_version_is_cached_until_written(monkeypatch):
+    session = boto3.session.Session(region_name="us-west-2")
+    client = _reference_bucket(session, "target", [])
+    manager = ReferenceBucketManager(session=session, s3_client=client)
+    now = [1000.0]
+    monkeypatch.setattr(manager_module.time, "monotonic", lambda: now[0])
+
+    with mock.patch.object(
+        type(client), "get_object", autospec=True, side_effect=type(client).get_object
+    ) as mock_get:
+        assert manager.read_bucket_version("target") == DEFAULT_REFERENCE_VERSION
+        assert manager.read_bucket_version("target") == DEFAULT_REFERENCE_VERSION
+        assert mock_get.call_count == 1
+
+        now[0] += 3600
+        manager.read_bucket_version("target")
+        assert mock_get.call_count == 2
+
+        manager.write_version_file("target", "0.0.1")
+        assert manager.read_bucket_version("target") == "0.0.1"
+        assert mock_get.call_count == 3
+
+
+def test_version_cache_ttl_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("DAYLILY_VERSION_CACHE_TTL", "0")
+    session = boto3.session.Session(region_name="us-west-2")
+    client = _reference_bucket(session, "target", [])
+    manager = ReferenceBucketManager(session=session, s3_client=client)
+
+    with mock.patch.object(
+        type(client), "get_object", autospec=True, side_effect=type(client).get_object
+    ) as mock_get:
+        manager.read_bucket_version("target")
+        manager.read_bucket_version("target")
+
+    assert mock_get.call_count == 2
+
+
 def test_ensure_bucket_missing_without_create():
     manager = ReferenceBucketManager()
     with mock.patch.object(manager, "bucket_exists", return_value=False):
@@ -137,6 +349,17 @@ def test_ensure_bucket_missing_without_create():
             )
 
 
+def test_ensure_bucket_clones_missing_bucket_with_single_probe():
+    manager = ReferenceBucketManager()
+    with mock.patch.object(manager, "bucket_exists", return_value=False) as mock_exists, \
+        mock.patch.object(manager, "create_bucket"), \
+        mock.patch.object(manager, "_copy_prefix"):
+        bucket = manager.ensure_bucket(bucket_prefix="test", region="us-west-2", dry_run=True)
+
+    assert bucket == "test-omics-analysis-us-west-2"
+    mock_exists.assert_called_once_with(bucket)
+
+
 def _mock_s3_client(region: str) -> mock.Mock:
     client = mock.Mock()
     client.meta = mock.Mock()
@@ -144,6 +367,62 @@ def _mock_s3_client(region: str) -> mock.Mock:
     return client
 
 
+def test_default_client_uses_pooled_config():
+    session = mock.Mock()
+
+    manager = ReferenceBucketManager(session=session, max_pool_connections=32)
+
+    _, kwargs = session.client.call_args
+    assert session.client.call_args.args == ("s3",)
+    assert kwargs["config"].max_pool_connections == 32
+    assert kwargs["config"].tcp_keepalive is True
+    assert manager.s3_client is session.client.return_value
+
+
+def test_default_managers_share_cached_client():
+    first = ReferenceBucketManager(profile="cache-test", region="us-west-2")
+    second = ReferenceBucketManager(profile="cache-test", region="us-west-2")
+    other = ReferenceBucketManager(profile="cache-test", region="eu-west-1")
+
+    assert first.session is not second.session
+    assert first.s3_client is second.s3_client
+    assert other.s3_client is not first.s3_client
+
+
+def test_ensure_bucket_probes_existing_bucket_once():
+    client = _mock_s3_client("us-west-2")
+    client.head_bucket.return_value = {}
+    client.head_object.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadObject")
+    client.get_object.side_effect = lambda **_: {
+        "Body": _version_body(DEFAULT_REFERENCE_VERSION),
+        "Metadata": {"sentinels": "1"},
+    }
+    prefixes = list(CORE_PREFIXES) + list(HG38_PREFIXES) + list(B37_PREFIXES) + list(GIAB_PREFIXES)
+    client.list_objects_v2.side_effect = lambda **kwargs: {
+        "CommonPrefixes": [
+            {"Prefix": prefix} for prefix in prefixes if prefix.startswith(kwargs["Prefix"])
+        ]
+    }
+    manager = ReferenceBucketManager(session=mock.Mock(), s3_client=client)
+
+    manager.ensure_bucket(bucket_prefix="test", region="us-west-2")
+    listings = client.list_objects_v2.call_count
+    sentinel_probes = client.head_object.call_count
+    manager.verify_bucket("test-omics-analysis-us-west-2")
+
+    # Reading the version marker proved the bucket exists.
+    client.head_bucket.assert_not_called()
+    client.get_object.assert_called_once()
+    assert sentinel_probes == len(prefixes)
+    assert 0 < listings < len(prefixes)
+    assert client.list_objects_v2.call_count == listings
+    assert client.head_object.call_count == sentinel_probes
+
+    manager.invalidate_cache()
+    manager.bucket_exists("test-omics-analysis-us-west-2")
+    client.head_bucket.assert_called_once_with(Bucket="test-omics-analysis-us-west-2")
+
+
 def _permanent_redirect_error(region: str) -> ClientError:
     return ClientError(
         {
@@ -170,6 +449,31 @@ def test_bucket_exists_redirects_to_bucket_region():
     assert manager.region == "us-west-2"
 
 
+def test_clone_reference_bucket_does_not_accelerate_by_default():
+    manager = ReferenceBucketManager()
+
+    with mock.patch.object(manager, "bucket_exists", return_value=False), \
+        mock.patch.object(manager, "create_bucket"), \
+        mock.patch.object(manager, "_copy_prefix") as mock_copy:
+        manager.clone_reference_bucket(bucket_prefix="test", region="eu-west-1", dry_run=True)
+
+    assert {call.kwargs["use_acceleration"] for call in mock_copy.call_args_list} == {False}
+
+
+def test_clone_reference_bucket_warns_when_acceleration_is_ignored(caplog):
+    manager = ReferenceBucketManager()
+
+    with mock.patch.object(manager, "bucket_exists", return_value=False), \
+        mock.patch.object(manager, "create_bucket"), \
+        mock.patch.object(manager, "_copy_prefix"), \
+        caplog.at_level("WARNING", logger=manager.logger.name):
+        manager.clone_reference_bucket(
+            bucket_prefix="test", region="us-west-2", dry_run=True, use_acceleration=True
+        )
+
+    assert "acceleration only applies to the cli copy method" in caplog.text
+
+
 def test_verify_bucket_handles_redirect(monkeypatch):
     session = mock.Mock()
     first = _mock_s3_client("us-east-1")
@@ -178,9 +482,14 @@ def test_verify_bucket_handles_redirect(monkeypatch):
 
     manager = ReferenceBucketManager(session=session, s3_client=first)
     first.head_bucket.side_effect = _permanent_redirect_error("us-west-2")
+    first.get_object.side_effect = _permanent_redirect_error("us-west-2")
 
     second.head_bucket.return_value = {}
-    second.get_object.return_value = {"Body": _version_body(DEFAULT_REFERENCE_VERSION)}
+    second.head_object.return_value = {}
+    second.get_object.return_value = {
+        "Body": _version_body(DEFAULT_REFERENCE_VERSION),
+        "Metadata": {"sentinels": "1"},
+    }
 
     def _list_objects_side_effect(**kwargs):
         return {"Contents": [{"Key": f"{kwargs['Prefix']}dummy"}]}
@@ -192,3 +501,613 @@ def test_verify_bucket_handles_redirect(monkeypatch):
     session.client.assert_called_once_with("s3", region_name="us-west-2")
     assert manager.s3_client is second
     assert manager.region == "us-west-2"
+
+
+def test_copy_prefix_boto3_copies_each_listed_key():
+    client = _mock_s3_client("us-west-2")
+    client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "data/lib/a"}, {"Key": "data/lib/b"}]},
+        {"Contents": [{"Key": "data/lib/c"}]},
+    ]
+    manager = ReferenceBucketManager(session=mock.Mock(), s3_client=client)
+    log_handle = io.StringIO()
+
+    copied = manager._copy_prefix_boto3(
+        source_bucket="src",
+        destination_bucket="dst",
+        prefix="data/lib/",
+        dry_run=False,
+        log_handle=log_handle,
+    )
+
+    assert copied == 3
+    client.get_paginator.return_value.paginate.assert_called_once_with(
+        Bucket="src", Prefix="data/lib/", RequestPayer="requester"
+    )
+    copied_keys = sorted(call.args[2] for call in client.copy.call_args_list)
+    assert copied_keys == ["data/lib/a", "data/lib/b", "data/lib/c"]
+    for call in client.copy.call_args_list:
+        assert call.args[0] == {"Bucket": "src", "Key": call.args[2]}
+        assert call.args[1] == "dst"
+        assert call.kwargs["ExtraArgs"] == {
+            "RequestPayer": "requester",
+            "MetadataDirective": "REPLACE",
+        }
+        assert call.kwargs["SourceClient"] is client
+    assert log_handle.getvalue().count("copy: s3://src/") == 3
+
+
+def test_copy_prefix_boto3_stops_submitting_when_stopped():
+    client = _mock_s3_client("us-west-2")
+    stop = threading.Event()
+
+    def _pages():
+        yield {"Contents": [{"Key": "data/lib/a"}]}
+        stop.set()
+        yield {"Contents": [{"Key": "data/lib/b"}]}
+
+    client.get_paginator.return_value.paginate.return_value = _pages()
+    manager = ReferenceBucketManager(session=mock.Mock(), s3_client=client)
+
+    with pytest.raises(RuntimeError, match="was stopped"):
+        manager._copy_prefix_boto3(
+            source_bucket="src",
+            destination_bucket="dst",
+            prefix="data/lib/",
+            dry_run=False,
+            log_handle=None,
+            stop=stop,
+        )
+
+    assert [call.args[2] for call in client.copy.call_args_list] == ["data/lib/a"]
+
+
+def test_clone_reference_bucket_stops_other_prefixes_on_failure(monkeypatch):
+    monkeypatch.setenv("DAYLILY_MAX_PREFIX_CONCURRENCY", "4")
+    manager = ReferenceBucketManager(session=mock.Mock(), s3_client=mock.Mock())
+    manager.s3_client.get_paginator.return_value.paginate.side_effect = lambda **kwargs: (
+        {"Contents": [{"Key": f"{kwargs['Prefix']}{index}"}]} for index in range(100_000)
+    )
+
+    def _copy(source, destination, key, **kwargs):
+        if key.startswith("data/lib/"):
+            raise RuntimeError("copy failed")
+
+    manager.s3_client.copy.side_effect = _copy
+
+    with mock.patch.object(manager, "bucket_exists", return_value=False), \
+        mock.patch.object(manager, "create_bucket"), \
+        mock.patch.object(manager, "write_version_file"), \
+        mock.patch.object(manager, "_write_prefix_sentinel") as mock_sentinel:
+        with pytest.raises(RuntimeError, match="copy failed"):
+            manager.clone_reference_bucket(bucket_prefix="test", region="us-west-2", dry_run=False)
+
+    plan = manager._build_copy_plan(include_mask=INCLUDE_ALL)
+    assert manager.s3_client.copy.call_count < len(plan) * 100_000
+    assert mock_sentinel.call_count < len(plan) - 1
+
+
+def test_copy_prefix_boto3_bounds_outstanding_copies(monkeypatch):
+    monkeypatch.setattr(manager_module, "_COPY_BACKLOG", 2)
+    client = _mock_s3_client("us-west-2")
+    client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": f"data/lib/{index}"} for index in range(10)]},
+    ]
+    manager = ReferenceBucketManager(session=mock.Mock(), s3_client=client)
+    outstanding = []
+
+    class _Executor:
+        def submit(self, func, *args):
+            future = mock.Mock()
+            future.result.side_effect = lambda: outstanding.remove(future) or func(*args)
+            outstanding.append(future)
+            assert len(outstanding) <= 2
+            return future
+
+    copied = manager._copy_prefix_boto3(
+        source_bucket="src",
+        destination_bucket="dst",
+        prefix="data/lib/",
+        dry_run=False,
+        log_handle=None,
+        executor=_Executor(),
+    )
+
+    assert copied == 10
+    assert not outstanding
+    assert manager_module._COPY_TRANSFER_CONFIG.use_threads is False
+    assert (
+        manager_module._COPY_TRANSFER_CONFIG.multipart_threshold
+        > manager_module._MAX_COPY_OBJECT_BYTES
+    )
+
+
+def test_clone_reference_bucket_copies_prefixes_concurrently(monkeypatch):
+    monkeypatch.setenv("DAYLILY_MAX_PREFIX_CONCURRENCY", "4")
+    manager = ReferenceBucketManager()
+    copied = []
+
+    def _record(**kwargs):
+        copied.append(kwargs["prefix"])
+        assert kwargs["executor"] is not None
+
+    with mock.patch.object(manager, "bucket_exists", return_value=False), \
+        mock.patch.object(manager, "create_bucket"), \
+        mock.patch.object(manager, "write_version_file"), \
+        mock.patch.object(manager, "_write_prefix_sentinel"), \
+        mock.patch.object(manager, "_copy_prefix", side_effect=_record):
+        manager.clone_reference_bucket(
+            bucket_prefix="test",
+            region="us-west-2",
+            dry_run=False,
+        )
+
+    expected = list(CORE_PREFIXES) + list(HG38_PREFIXES) + list(B37_PREFIXES) + list(GIAB_PREFIXES)
+    assert sorted(copied) == sorted(expected)
+
+
+def test_clone_reference_bucket_propagates_prefix_failure():
+    manager = ReferenceBucketManager()
+
+    def _fail_on_lib(**kwargs):
+        if kwargs["prefix"] == "data/lib/":
+            raise RuntimeError("copy failed")
+
+    with mock.patch.object(manager, "bucket_exists", return_value=False), \
+        mock.patch.object(manager, "create_bucket"), \
+        mock.patch.object(manager, "write_version_file"), \
+        mock.patch.object(manager, "_write_prefix_sentinel"), \
+        mock.patch.object(manager, "_copy_prefix", side_effect=_fail_on_lib):
+        with pytest.raises(RuntimeError, match="copy failed"):
+            manager.clone_reference_bucket(
+                bucket_prefix="test",
+                region="us-west-2",
+                dry_run=False,
+            )
+
+
+def test_copy_prefix_s3_batch_submits_job_and_waits(monkeypatch):
+    monkeypatch.setattr(manager_module, "_BATCH_POLL_SECONDS", 0)
+    client = _mock_s3_client("us-west-2")
+    client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "data/lib/a b"}, {"Key": "data/lib/c"}]},
+    ]
+    client.put_object.return_value = {"ETag": '"etag"'}
+    sts = mock.Mock()
+    sts.get_caller_identity.return_value = {"Account": "123456789012"}
+    s3control = mock.Mock()
+    s3control.create_job.return_value = {"JobId": "job-1"}
+    s3control.describe_job.side_effect = [
+        {"Job": {"Status": "Active"}},
+        {"Job": {"Status": "Complete", "ProgressSummary": {"NumberOfTasksFailed": 0}}},
+    ]
+    session = mock.Mock()
+    session.client.side_effect = lambda name, **_: {"sts": sts, "s3control": s3control}[name]
+    manager = ReferenceBucketManager(
+        session=session, s3_client=client, batch_role_arn="arn:aws:iam::123456789012:role/batch"
+    )
+
+    manager._copy_prefix_s3_batch(
+        source_bucket="src",
+        destination_bucket="dst",
+        prefix="data/lib/",
+        dry_run=False,
+        destination_region="eu-west-1",
+    )
+
+    assert {call.kwargs["region_name"] for call in session.client.call_args_list} == {
+        "eu-west-1"
+    }
+    client.delete_object.assert_called_once_with(Bucket="dst", Key="_manifests/data/lib.csv")
+    client.put_object.assert_called_once_with(
+        Bucket="dst",
+        Key="_manifests/data/lib.csv",
+        Body=b"src,data/lib/a%20b\nsrc,data/lib/c\n",
+    )
+    job = s3control.create_job.call_args.kwargs
+    assert job["AccountId"] == "123456789012"
+    assert job["RoleArn"] == "arn:aws:iam::123456789012:role/batch"
+    assert job["Operation"]["S3PutObjectCopy"]["TargetResource"] == "arn:aws:s3:::dst"
+    assert job["Manifest"]["Location"] == {
+        "ObjectArn": "arn:aws:s3:::dst/_manifests/data/lib.csv",
+        "ETag": '"etag"',
+    }
+    assert s3control.describe_job.call_count == 2
+    s3control.update_job_status.assert_not_called()
+
+
+def test_copy_prefix_s3_batch_cancels_job_on_timeout(monkeypatch):
+    monkeypatch.setattr(manager_module, "_BATCH_POLL_SECONDS", 0)
+    client = _mock_s3_client("us-west-2")
+    client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "data/lib/a"}]},
+    ]
+    client.put_object.return_value = {"ETag": '"etag"'}
+    s3control = mock.Mock()
+    s3control.create_job.return_value = {"JobId": "job-1"}
+    s3control.describe_job.return_value = {"Job": {"Status": "Active"}}
+    session = mock.Mock()
+    session.client.side_effect = lambda name, **_: {
+        "sts": mock.Mock(**{"get_caller_identity.return_value": {"Account": "1"}}),
+        "s3control": s3control,
+    }[name]
+    manager = ReferenceBucketManager(session=session, s3_client=client, batch_role_arn="role")
+
+    with pytest.raises(TimeoutError):
+        manager._copy_prefix_s3_batch(
+            source_bucket="src",
+            destination_bucket="dst",
+            prefix="data/lib/",
+            dry_run=False,
+            timeout=0,
+        )
+
+    assert s3control.update_job_status.call_args.kwargs["RequestedJobStatus"] == "Cancelled"
+    client.delete_object.assert_called_once_with(Bucket="dst", Key="_manifests/data/lib.csv")
+
+
+def test_copy_prefix_s3_batch_cancels_job_when_stopped():
+    client = _mock_s3_client("us-west-2")
+    client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "data/lib/a"}]},
+    ]
+    client.put_object.return_value = {"ETag": '"etag"'}
+    s3control = mock.Mock()
+    s3control.create_job.return_value = {"JobId": "job-1"}
+    s3control.describe_job.return_value = {"Job": {"Status": "Active"}}
+    session = mock.Mock()
+    session.client.side_effect = lambda name, **_: {
+        "sts": mock.Mock(**{"get_caller_identity.return_value": {"Account": "1"}}),
+        "s3control": s3control,
+    }[name]
+    manager = ReferenceBucketManager(session=session, s3_client=client, batch_role_arn="role")
+    stop = threading.Event()
+    stop.set()
+
+    with pytest.raises(RuntimeError, match="was stopped"):
+        manager._copy_prefix_s3_batch(
+            source_bucket="src",
+            destination_bucket="dst",
+            prefix="data/lib/",
+            dry_run=False,
+            stop=stop,
+        )
+
+    assert s3control.update_job_status.call_args.kwargs["RequestedJobStatus"] == "Cancelled"
+    client.delete_object.assert_called_once_with(Bucket="dst", Key="_manifests/data/lib.csv")
+
+
+def test_clone_reference_bucket_stops_running_copies_on_interrupt(monkeypatch):
+    monkeypatch.setenv("DAYLILY_MAX_PREFIX_CONCURRENCY", "4")
+    manager = ReferenceBucketManager()
+    stopped = []
+
+    def _copy(**kwargs):
+        if kwargs["prefix"] == "data/lib/":
+            raise KeyboardInterrupt
+        # Stands in for a long batch job polling until the clone stops it.
+        stopped.append(kwargs["stop"].wait(5))
+        return 1
+
+    with mock.patch.object(manager, "bucket_exists", return_value=False), \
+        mock.patch.object(manager, "create_bucket"), \
+        mock.patch.object(manager, "write_version_file"), \
+        mock.patch.object(manager, "_write_prefix_sentinel"), \
+        mock.patch.object(manager, "_copy_prefix", side_effect=_copy):
+        with pytest.raises(KeyboardInterrupt):
+            manager.clone_reference_bucket(
+                bucket_prefix="test", region="us-west-2", dry_run=False
+            )
+
+    assert stopped and all(stopped)
+
+
+def test_clone_reference_bucket_s3_batch_falls_back_without_role():
+    manager = ReferenceBucketManager()
+
+    with mock.patch.object(manager, "bucket_exists", return_value=False), \
+        mock.patch.object(manager, "create_bucket"), \
+        mock.patch.object(manager, "_copy_prefix") as mock_copy:
+        manager.clone_reference_bucket(
+            bucket_prefix="test",
+            region="us-west-2",
+            dry_run=True,
+            method="s3-batch",
+        )
+
+    assert {call.kwargs["method"] for call in mock_copy.call_args_list} == {"boto3"}
+
+
+def test_clone_reference_bucket_async_falls_back_without_aioboto3(monkeypatch):
+    monkeypatch.setattr(manager_module, "aioboto3", None)
+    manager = ReferenceBucketManager()
+
+    with mock.patch.object(manager, "bucket_exists", return_value=False), \
+        mock.patch.object(manager, "create_bucket"), \
+        mock.patch.object(manager, "_copy_prefix") as mock_copy:
+        manager.clone_reference_bucket(
+            bucket_prefix="test",
+            region="us-west-2",
+            dry_run=True,
+            method="async",
+        )
+
+    assert {call.kwargs["method"] for call in mock_copy.call_args_list} == {"boto3"}
+
+
+class _FakeAioS3Client:
+    def __init__(self, pages, fail_on=None):
+        self.pages = pages
+        self.fail_on = fail_on
+        self.copied = []
+        self.managed = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def get_paginator(self, name):
+        assert name == "list_objects_v2"
+        return self
+
+    async def paginate(self, **kwargs):
+        for page in self.pages:
+            contents = [
+                item for item in page["Contents"] if item["Key"].startswith(kwargs["Prefix"])
+            ]
+            if contents:
+                yield {"Contents": contents}
+
+    async def copy_object(self, **kwargs):
+        assert kwargs["CopySource"] == {"Bucket": "src", "Key": kwargs["Key"]}
+        assert kwargs["RequestPayer"] == "requester"
+        if kwargs["Key"] == self.fail_on:
+            raise ClientError({"Error": {"Code": "AccessDenied"}}, "CopyObject")
+        self.copied.append(kwargs["Key"])
+
+    async def copy(self, copy_source, bucket, key, ExtraArgs, SourceClient):
+        assert SourceClient is self
+        self.managed.append(key)
+
+
+def _fake_aioboto3(monkeypatch, client):
+    aioboto3 = mock.Mock()
+    aioboto3.Session.return_value.client.return_value = client
+    monkeypatch.setattr(manager_module, "aioboto3", aioboto3)
+    monkeypatch.setattr(manager_module, "AioConfig", Config, raising=False)
+    return aioboto3
+
+
+_ASYNC_PAGES = [
+    {"Contents": [{"Key": "data/lib/a", "Size": 1}, {"Key": "data/lib/b", "Size": 1}]},
+    {"Contents": [{"Key": "data/lib/huge", "Size": 6 * 1024**3}, {"Key": "data/x/c", "Size": 1}]},
+]
+
+
+def test_copy_prefixes_async_copies_each_listed_key(monkeypatch):
+    client = _FakeAioS3Client(_ASYNC_PAGES)
+    _fake_aioboto3(monkeypatch, client)
+    manager = ReferenceBucketManager(session=mock.Mock(), s3_client=mock.Mock())
+    log_handle = io.StringIO()
+
+    copied = manager._copy_prefixes_async(
+        source_bucket="src",
+        destination_bucket="dst",
+        prefixes=["data/lib/"],
+        log_handle=log_handle,
+    )
+
+    assert copied == {"data/lib/": 3}
+    assert sorted(client.copied) == ["data/lib/a", "data/lib/b"]
+    assert client.managed == ["data/lib/huge"]
+    assert log_handle.getvalue().count("copy: s3://src/") == 3
+
+
+def test_copy_prefixes_async_shares_one_client_and_runs_inside_a_loop(monkeypatch):
+    client = _FakeAioS3Client(_ASYNC_PAGES)
+    aioboto3 = _fake_aioboto3(monkeypatch, client)
+    manager = ReferenceBucketManager(session=mock.Mock(), s3_client=mock.Mock())
+
+    async def _from_running_loop():
+        return manager._copy_prefixes_async(
+            source_bucket="src",
+            destination_bucket="dst",
+            prefixes=["data/lib/", "data/x/"],
+            log_handle=None,
+        )
+
+    copied = asyncio.run(_from_running_loop())
+
+    assert copied == {"data/lib/": 3, "data/x/": 1}
+    aioboto3.Session.assert_called_once()
+    aioboto3.Session.return_value.client.assert_called_once()
+
+
+def test_copy_prefixes_async_propagates_copy_failure(monkeypatch):
+    client = _FakeAioS3Client(_ASYNC_PAGES, fail_on="data/lib/b")
+    _fake_aioboto3(monkeypatch, client)
+    manager = ReferenceBucketManager(session=mock.Mock(), s3_client=mock.Mock())
+
+    with pytest.raises(ClientError):
+        manager._copy_prefixes_async(
+            source_bucket="src",
+            destination_bucket="dst",
+            prefixes=["data/lib/", "data/x/"],
+            log_handle=None,
+        )
+
+
+def test_clone_writes_sentinels_that_verification_uses():
+    session = boto3.session.Session(region_name="us-west-2")
+    client = session.client("s3")
+    manager = ReferenceBucketManager(session=session, s3_client=client)
+
+    with mock.patch.object(manager, "_copy_prefix", return_value=1):
+        bucket = manager.clone_reference_bucket(
+            bucket_prefix="test",
+            region="us-west-2",
+            dry_run=False,
+        )
+
+    with mock.patch.object(type(client), "list_objects_v2") as mock_list:
+        manager.invalidate_cache()
+        manager.verify_bucket(bucket)
+
+    mock_list.assert_not_called()
+
+
+def test_run_copy_command_reuses_child_env():
+    stdout = "copy: s3://src/a to s3://dst/a\n"
+    runner = mock.Mock(return_value=mock.Mock(returncode=0, stdout=stdout, stderr=""))
+    manager = ReferenceBucketManager(
+        profile="daylily", session=mock.Mock(), s3_client=mock.Mock(), command_runner=runner
+    )
+    log_handle = io.StringIO()
+
+    for prefix in ("data/lib/", "data/cached_envs/"):
+        assert manager._run_copy_command(
+            source_bucket="src",
+            destination_bucket="dst",
+            prefix=prefix,
+            dry_run=False,
+            use_acceleration=False,
+            log_handle=log_handle,
+        ) == 1
+
+    first_env, second_env = (call.kwargs["env"] for call in runner.call_args_list)
+    assert first_env is second_env
+    assert first_env["AWS_PROFILE"] == "daylily"
+    assert log_handle.getvalue().count("$ aws s3 cp s3://src/") == 2
+
+
+def test_clone_reference_bucket_builds_cli_command_once():
+    runner = mock.Mock(return_value=mock.Mock(returncode=0, stdout="", stderr=""))
+    manager = ReferenceBucketManager(
+        session=mock.Mock(), s3_client=mock.Mock(), command_runner=runner
+    )
+
+    with mock.patch.object(manager, "bucket_exists", return_value=False), mock.patch.object(
+        manager, "create_bucket"
+    ), mock.patch.object(manager, "write_version_file"), mock.patch.object(
+        manager, "_write_prefix_sentinel"
+    ), mock.patch(
+        "daylily_omics_references.manager._copy_command_template",
+        wraps=manager_module._copy_command_template,
+    ) as template:
+        manager.clone_reference_bucket(
+            bucket_prefix="demo",
+            region="us-west-2",
+            dry_run=False,
+            method="cli",
+            use_acceleration=True,
+        )
+
+    template.assert_called_once_with(request_payer="requester", use_acceleration=True)
+    commands = [call.args[0] for call in runner.call_args_list]
+    assert len(commands) == len(manager._build_copy_plan(include_mask=INCLUDE_ALL))
+    assert {command[3] for command in commands} == {
+        f"s3://daylily-omics-analysis-references-public/{op.source_prefix}"
+        for op in manager._build_copy_plan(include_mask=INCLUDE_ALL)
+    }
+    assert all(command[-1] == "https://s3-accelerate.amazonaws.com" for command in commands)
+
+
+def test_clone_reference_bucket_opens_log_file_once(tmp_path):
+    manager = ReferenceBucketManager()
+    log_file = tmp_path / "logs" / "clone.log"
+    handles = set()
+
+    def _record(**kwargs):
+        handles.add(id(kwargs["log_handle"]))
+        kwargs["log_handle"].write(f"{kwargs['prefix']}\n")
+
+    with mock.patch.object(manager, "bucket_exists", return_value=False), \
+        mock.patch.object(manager, "create_bucket"), \
+        mock.patch.object(manager, "write_version_file"), \
+        mock.patch.object(manager, "_write_prefix_sentinel"), \
+        mock.patch.object(manager, "_copy_prefix", side_effect=_record):
+        manager.clone_reference_bucket(
+            bucket_prefix="test",
+            region="us-west-2",
+            dry_run=False,
+            log_file=str(log_file),
+        )
+
+    assert len(handles) == 1
+    assert sorted(log_file.read_text().splitlines()) == sorted(
+        list(CORE_PREFIXES) + list(HG38_PREFIXES) + list(B37_PREFIXES) + list(GIAB_PREFIXES)
+    )
+
+
+def test_verify_bucket_lists_only_prefixes_without_sentinels():
+    session = boto3.session.Session(region_name="us-west-2")
+    client = session.client("s3")
+    manager = ReferenceBucketManager(session=session, s3_client=client)
+    prefixes = list(CORE_PREFIXES) + list(HG38_PREFIXES) + list(B37_PREFIXES) + list(GIAB_PREFIXES)
+
+    client.create_bucket(Bucket="target")
+    manager.write_version_file("target", DEFAULT_REFERENCE_VERSION)
+    for prefix in prefixes:
+        client.put_object(Bucket="target", Key=f"{prefix}dummy", Body=b"data")
+    for prefix in prefixes[2:]:
+        manager._write_prefix_sentinel("target", prefix)
+
+    with mock.patch.object(
+        type(client), "list_objects_v2", autospec=True, side_effect=type(client).list_objects_v2
+    ) as mock_list:
+        manager.verify_bucket("target")
+
+    listed = sorted(call.kwargs["Prefix"] for call in mock_list.call_args_list)
+    assert listed == sorted(prefixes[:2])
+
+
+def test_verify_bucket_skips_sentinels_for_buckets_cloned_without_them():
+    session = boto3.session.Session(region_name="us-west-2")
+    prefixes = list(CORE_PREFIXES) + list(HG38_PREFIXES) + list(B37_PREFIXES) + list(GIAB_PREFIXES)
+    client = _reference_bucket(session, "target", prefixes)
+    manager = ReferenceBucketManager(session=session, s3_client=client)
+
+    with mock.patch.object(
+        type(client), "head_object", autospec=True, side_effect=type(client).head_object
+    ) as mock_head:
+        manager.verify_bucket("target")
+
+    mock_head.assert_not_called()
+
+
+def test_clone_writes_sentinels_only_for_copied_prefixes():
+    manager = ReferenceBucketManager()
+
+    with mock.patch.object(manager, "bucket_exists", return_value=False), \
+        mock.patch.object(manager, "create_bucket"), \
+        mock.patch.object(manager, "write_version_file"), \
+        mock.patch.object(manager, "_write_prefix_sentinel") as mock_sentinel, \
+        mock.patch.object(
+            manager, "_copy_prefix", side_effect=lambda **kwargs: int(kwargs["prefix"] != "data/lib/")
+        ):
+        manager.clone_reference_bucket(bucket_prefix="test", region="us-west-2", dry_run=False)
+
+    written = {call.args[1] for call in mock_sentinel.call_args_list}
+    assert "data/lib/" not in written
+    assert len(written) == len(manager._build_copy_plan(include_mask=INCLUDE_ALL)) - 1
+
+
+@pytest.mark.parametrize(
+    "marker,expected",
+    [
+        (b"", ""),
+        (b"0.7.131c\n", "0.7.131c"),
+        (b"x" * 100, "x" * 64),
+    ],
+)
+def test_read_bucket_version_reads_bounded_range(marker: bytes, expected: str):
+    session = boto3.session.Session(region_name="us-west-2")
+    client = session.client("s3")
+    manager = ReferenceBucketManager(session=session, s3_client=client)
+    client.create_bucket(Bucket="target")
+    client.put_object(Bucket="target", Key=VERSION_INFO_KEY, Body=marker)
+
+    assert manager.read_bucket_version("target") == expected
+    assert manager.read_bucket_version("missing") is None